@@ -33,7 +33,7 @@ fi
 trap 'kill $(jobs -p)' EXIT
 
 echo -e "${GREEN}Starting Backend (FastAPI)...${NC}"
-uvicorn src.ssr_service.api:app --reload --port 8000 &
+uvicorn src.ssr_service.api:app --reload --port 8000 --loop uvloop --http httptools &
 
 echo -e "${GREEN}Starting Frontend (Vite)...${NC}"
 cd web_ui
@@ -34,76 +34,153 @@ Usage:
 from __future__ import annotations
 
 import argparse
+import asyncio
+import importlib
 import json
+from itertools import islice
+from operator import attrgetter
 from pathlib import Path
-from typing import Iterable, List
+from typing import Iterable, List, Tuple
 
-import yaml
+import numpy as np
+
+try:
+    import uvloop
+except ImportError:  # pragma: no cover - uvloop is optional
+    uvloop = None  # type: ignore[assignment]
 
 from ssr_service.config import get_settings
+from ssr_service.documents import load_yaml
 from ssr_service.models import PersonaSpec, PopulationSpec
 from ssr_service.personas import combine_persona_buckets, get_persona_library
 from ssr_service.population import buckets_from_population_spec, rake_personas
 
+FIELDNAMES = (
+    "name",
+    "age",
+    "gender",
+    "income",
+    "region",
+    "occupation",
+    "education",
+    "household",
+    "purchase_frequency",
+    "usage_context",
+    "background",
+    "habits",
+    "motivations",
+    "pain_points",
+    "preferred_channels",
+    "descriptors",
+    "notes",
+    "source",
+    "weight",
+)
+
+_CSV_SPECIAL = frozenset(',"\r\n')
+_CSV_EOL = "\r\n"
+_WRITE_BUFFER_SIZE = 1 << 20
+_ROWS_PER_WRITE = 1024
+_LIST_FIELDS = attrgetter(
+    "habits", "motivations", "pain_points", "preferred_channels", "descriptors"
+)
+
+
+def _csv_field(value: str) -> str:
+    if _CSV_SPECIAL.isdisjoint(value):
+        return value
+    return '"' + value.replace('"', '""') + '"'
+
+
+def _joined_lists(persona: PersonaSpec) -> Tuple[str, ...]:
+    habits, motivations, pain_points, channels, descriptors = _LIST_FIELDS(persona)
+    return (
+        ";".join(filter(None, habits)) if habits else "",
+        ";".join(filter(None, motivations)) if motivations else "",
+        ";".join(filter(None, pain_points)) if pain_points else "",
+        ";".join(filter(None, channels)) if channels else "",
+        ";".join(filter(None, descriptors)) if descriptors else "",
+    )
+
+
+def _row_fields(
+    persona: PersonaSpec, joined: Tuple[str, ...], weight: str
+) -> Tuple[str, ...]:
+    return (
+        persona.name,
+        persona.age or "",
+        persona.gender or "",
+        persona.income or "",
+        persona.region or "",
+        persona.occupation or "",
+        persona.education or "",
+        persona.household or "",
+        persona.purchase_frequency or "",
+        persona.usage_context or "",
+        persona.background or "",
+        *joined,
+        persona.notes or "",
+        persona.source or "",
+        weight,
+    )
+
+
+def _csv_row(persona: PersonaSpec, joined: Tuple[str, ...], weight: str) -> str:
+    return ",".join(map(_csv_field, _row_fields(persona, joined, weight))) + _CSV_EOL
+
+
+def _chunk_columns(chunk: List[PersonaSpec]) -> Tuple[List[Tuple[str, ...]], List[str]]:
+    weights = np.fromiter(
+        (persona.weight for persona in chunk), dtype=float, count=len(chunk)
+    )
+    joined = [_joined_lists(persona) for persona in chunk]
+    return joined, np.char.mod("%.6f", weights).tolist()
+
+
+def dump_csv(personas: Iterable[PersonaSpec], path: Path) -> int:
+    """Stream personas to ``path`` in fixed-size chunks and return the row count."""
+    iterator = iter(personas)
+    count = 0
+    with path.open(
+        "w", encoding="utf-8", newline="", buffering=_WRITE_BUFFER_SIZE
+    ) as fh:
+        fh.write(",".join(FIELDNAMES) + _CSV_EOL)
+        while chunk := list(islice(iterator, _ROWS_PER_WRITE)):
+            joined, weight_strs = _chunk_columns(chunk)
+            fh.write("".join(map(_csv_row, chunk, joined, weight_strs)))
+            count += len(chunk)
+    return count
+
+
+def dump_csv_arrow(personas: Iterable[PersonaSpec], path: Path) -> int:
+    """Write personas through pyarrow's C++ CSV writer; falls back to ``dump_csv``."""
+    try:
+        pa = importlib.import_module("pyarrow")
+        pa_csv = importlib.import_module("pyarrow.csv")
+    except ImportError:
+        print("pyarrow is not installed; using the standard CSV writer")
+        return dump_csv(personas, path)
+
+    rows: List[Tuple[str, ...]] = []
+    iterator = iter(personas)
+    while chunk := list(islice(iterator, _ROWS_PER_WRITE)):
+        joined, weight_strs = _chunk_columns(chunk)
+        rows.extend(map(_row_fields, chunk, joined, weight_strs))
+
+    columns = zip(*rows) if rows else ((),) * len(FIELDNAMES)
+    table = pa.table(
+        {
+            name: pa.array(values, type=pa.string())
+            for name, values in zip(FIELDNAMES, columns)
+        }
+    )
+    pa_csv.write_csv(
+        table, str(path), write_options=pa_csv.WriteOptions(include_header=True)
+    )
+    return len(rows)
+
 
-def dump_csv(personas: Iterable[PersonaSpec], path: Path) -> None:
-    import csv
-
-    def join(values: List[str]) -> str:
-        return ";".join(v for v in values if v)
-
-    fieldnames = [
-        "name",
-        "age",
-        "gender",
-        "income",
-        "region",
-        "occupation",
-        "education",
-        "household",
-        "purchase_frequency",
-        "usage_context",
-        "background",
-        "habits",
-        "motivations",
-        "pain_points",
-        "preferred_channels",
-        "descriptors",
-        "notes",
-        "source",
-        "weight",
-    ]
-
-    with path.open("w", encoding="utf-8", newline="") as fh:
-        writer = csv.DictWriter(fh, fieldnames=fieldnames)
-        writer.writeheader()
-        for persona in personas:
-            writer.writerow(
-                {
-                    "name": persona.name,
-                    "age": persona.age or "",
-                    "gender": persona.gender or "",
-                    "income": persona.income or "",
-                    "region": persona.region or "",
-                    "occupation": persona.occupation or "",
-                    "education": persona.education or "",
-                    "household": persona.household or "",
-                    "purchase_frequency": persona.purchase_frequency or "",
-                    "usage_context": persona.usage_context or "",
-                    "background": persona.background or "",
-                    "habits": join(persona.habits),
-                    "motivations": join(persona.motivations),
-                    "pain_points": join(persona.pain_points),
-                    "preferred_channels": join(persona.preferred_channels),
-                    "descriptors": join(persona.descriptors),
-                    "notes": persona.notes or "",
-                    "source": persona.source or "",
-                    "weight": f"{persona.weight:.6f}",
-                }
-            )
-
-
-async def main() -> None:
+def main() -> None:
     parser = argparse.ArgumentParser(description="Build persona CSV from population spec")
     parser.add_argument("--spec", type=Path, required=True, help="Spec YAML/JSON path")
     parser.add_argument("--output", type=Path, required=True, help="Destination CSV path")
@@ -113,6 +190,11 @@ async def main() -> None:
         default=None,
         help="Persona library directory (defaults to settings)",
     )
+    parser.add_argument(
+        "--arrow",
+        action="store_true",
+        help="Write the CSV with pyarrow (faster for large populations)",
+    )
     args = parser.parse_args()
 
     settings = get_settings()
@@ -120,27 +202,33 @@ async def main() -> None:
 
     raw_text = args.spec.read_text(encoding="utf-8")
     try:
-        payload = yaml.safe_load(raw_text)
-    except Exception:
         payload = json.loads(raw_text)
+    except json.JSONDecodeError:
+        payload = load_yaml(raw_text)
 
     population_spec = PopulationSpec.model_validate(payload)
     library = get_persona_library(str(library_dir))
 
-    buckets = await buckets_from_population_spec(population_spec, library, settings)
+    # Only persona generation performs network I/O, so it is the sole step that
+    # needs an event loop.
+    run = uvloop.run if uvloop is not None else asyncio.run
+    buckets = run(buckets_from_population_spec(population_spec, library, settings))
     if not buckets:
         raise SystemExit("Spec produced no personas; add base_group, filters, generations, or injections")
 
-    personas = combine_persona_buckets(buckets)
-    personas = rake_personas(personas, population_spec.marginals, population_spec.raking)
+    personas = rake_personas(
+        combine_persona_buckets(buckets),
+        population_spec.marginals,
+        population_spec.raking,
+    )
+    del buckets
 
     args.output.parent.mkdir(parents=True, exist_ok=True)
-    dump_csv(personas, args.output)
-    print(f"Wrote {len(personas)} personas to {args.output}")
+    writer = dump_csv_arrow if args.arrow else dump_csv
+    written = writer(personas, args.output)
+    print(f"Wrote {written} personas to {args.output}")
 
 
 if __name__ == "__main__":
-    import asyncio
-
-    asyncio.run(main())
+    main()
 
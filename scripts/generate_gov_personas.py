@@ -1,84 +1,83 @@
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import cache, lru_cache
+from importlib.util import find_spec
+from io import StringIO
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, List, Tuple
 
-import requests
+import httpx
+import numpy as np
 import yaml
 
+from ssr_service.documents import write_sidecar
+
+try:
+    from yaml import CSafeDumper as _YamlDumper
+except ImportError:  # pragma: no cover - LibYAML not available
+    from yaml import SafeDumper as _YamlDumper  # type: ignore[assignment]
+
 CENSUS_BASE = "https://api.census.gov/data/2022/acs/acs1"
 DATA_DIR = Path("src/ssr_service/data/personas")
 DATA_DIR.mkdir(parents=True, exist_ok=True)
 
+# One pooled client shared by the generator threads so every Census call reuses
+# the same TLS connection (multiplexed over HTTP/2 when h2 is installed).
+_CLIENT = httpx.Client(http2=find_spec("h2") is not None, timeout=30)
+
+# B01001 age-by-sex codes for the toothpaste personas, ordered so that each age
+# band (male then female counts) is a contiguous run described by GROUP_SLICES.
+CODE_ORDER = [
+    "B01001_007E", "B01001_008E", "B01001_009E", "B01001_010E",
+    "B01001_031E", "B01001_032E", "B01001_033E", "B01001_034E",
+    "B01001_011E", "B01001_012E", "B01001_013E", "B01001_014E",
+    "B01001_035E", "B01001_036E", "B01001_037E", "B01001_038E",
+    "B01001_015E", "B01001_016E", "B01001_017E", "B01001_018E", "B01001_019E",
+    "B01001_039E", "B01001_040E", "B01001_041E", "B01001_042E", "B01001_043E",
+    "B01001_020E", "B01001_021E", "B01001_022E", "B01001_023E",
+    "B01001_024E", "B01001_025E",
+    "B01001_044E", "B01001_045E", "B01001_046E", "B01001_047E",
+    "B01001_048E", "B01001_049E",
+]
+GROUP_SLICES = {
+    "18-24": slice(0, 8),
+    "25-44": slice(8, 16),
+    "45-64": slice(16, 26),
+    "65+": slice(26, 38),
+}
+
 
-def fetch_census(variables: List[str]) -> Dict[str, int]:
+@lru_cache(maxsize=None)
+def _fetch_census_table(variables: Tuple[str, ...]) -> Tuple[List[str], List[str]]:
     params = {
-        "get": ",".join(["NAME"] + variables),
+        "get": ",".join(("NAME",) + variables),
         "for": "us:1",
     }
-    resp = requests.get(CENSUS_BASE, params=params, timeout=30)
+    resp = _CLIENT.get(CENSUS_BASE, params=params)
     resp.raise_for_status()
     data = resp.json()
-    header = data[0]
-    values = data[1]
-    return {var: int(values[header.index(var)]) for var in variables}
+    return data[0], data[1]
 
 
-def make_us_toothpaste() -> Dict:
-    vars_needed = [
-        "B01001_007E", "B01001_008E", "B01001_009E", "B01001_010E",
-        "B01001_031E", "B01001_032E", "B01001_033E", "B01001_034E",
-        "B01001_011E", "B01001_012E", "B01001_013E", "B01001_014E",
-        "B01001_035E", "B01001_036E", "B01001_037E", "B01001_038E",
-        "B01001_015E", "B01001_016E", "B01001_017E", "B01001_018E", "B01001_019E",
-        "B01001_039E", "B01001_040E", "B01001_041E", "B01001_042E", "B01001_043E",
-        "B01001_020E",
-        "B01001_021E",
-        "B01001_022E",
-        "B01001_023E",
-        "B01001_024E",
-        "B01001_025E",
-        "B01001_044E",
-        "B01001_045E",
-        "B01001_046E",
-        "B01001_047E",
-        "B01001_048E",
-        "B01001_049E",
-    ]
-    data = fetch_census(vars_needed)
+def fetch_census(variables: List[str]) -> List[int]:
+    """Return the US-level estimates for ``variables`` in the order requested."""
+    header, values = _fetch_census_table(tuple(variables))
+    index = {name: position for position, name in enumerate(header)}
+    return [int(values[index[var]]) for var in variables]
 
-    def total(codes: List[str]) -> int:
-        return sum(data[c] for c in codes)
 
-    groups = {
-        "18-24": total([
-            "B01001_007E", "B01001_008E", "B01001_009E", "B01001_010E",
-            "B01001_031E", "B01001_032E", "B01001_033E", "B01001_034E",
-        ]),
-        "25-44": total([
-            "B01001_011E", "B01001_012E", "B01001_013E", "B01001_014E",
-            "B01001_035E", "B01001_036E", "B01001_037E", "B01001_038E",
-        ]),
-        "45-64": total([
-            "B01001_015E", "B01001_016E", "B01001_017E", "B01001_018E", "B01001_019E",
-            "B01001_039E", "B01001_040E", "B01001_041E", "B01001_042E", "B01001_043E",
-        ]),
-        "65+": total(
-            [
-                "B01001_020E",
-                "B01001_021E",
-                "B01001_022E",
-                "B01001_023E",
-                "B01001_024E",
-                "B01001_025E",
-                "B01001_044E",
-                "B01001_045E",
-                "B01001_046E",
-                "B01001_047E",
-                "B01001_048E",
-                "B01001_049E",
-            ]
-        ),
-    }
-    total_pop = sum(groups.values())
+def normalized_shares(counts: Dict[str, int]) -> Dict[str, float]:
+    """Convert segment counts to 4-decimal shares that sum to exactly 1."""
+    weights = np.array(list(counts.values()), dtype=np.float64)
+    weights = np.round(weights / weights.sum(), 4)
+    weights[-1] = round(1.0 - weights[:-1].sum(), 4)
+    return {name: float(weight) for name, weight in zip(counts, weights)}
+
+
+@cache
+def make_us_toothpaste() -> Dict:
+    values = np.array(fetch_census(CODE_ORDER), dtype=np.int64)
+    groups = {band: int(values[span].sum()) for band, span in GROUP_SLICES.items()}
+    shares = normalized_shares(groups)
 
     personas = [
         {
@@ -109,7 +108,7 @@ def make_us_toothpaste() -> Dict:
             "pain_points": ["worries about enamel sensitivity"],
             "preferred_channels": ["TikTok", "Discount retailers"],
             "notes": "Looks for bundle deals that include whitening strips.",
-            "weight": round(groups["18-24"] / total_pop, 4),
+            "weight": shares["18-24"],
         },
         {
             "name": "Prime Working Age 25-44",
@@ -131,7 +130,7 @@ def make_us_toothpaste() -> Dict:
             "pain_points": ["dislikes mess from whitening gels"],
             "preferred_channels": ["Big-box retailers", "Online delivery services"],
             "notes": "Open to auto-ship refills with kid-friendly flavors.",
-            "weight": round(groups["25-44"] / total_pop, 4),
+            "weight": shares["25-44"],
         },
         {
             "name": "Midlife Households 45-64",
@@ -161,7 +160,7 @@ def make_us_toothpaste() -> Dict:
             "pain_points": ["skeptical of gimmicky claims"],
             "preferred_channels": ["Warehouse clubs", "Dental offices"],
             "notes": "Appreciates subscription programs that include refill reminders.",
-            "weight": round(groups["45-64"] / total_pop, 4),
+            "weight": shares["45-64"],
         },
         {
             "name": "Older Adults 65+",
@@ -188,7 +187,7 @@ def make_us_toothpaste() -> Dict:
             "pain_points": ["dislikes strong abrasives or overpowering mint"],
             "preferred_channels": ["Pharmacies", "Direct mail catalogs"],
             "notes": "Responds well to senior discounts and caregiver bundles.",
-            "weight": round(groups["65+"] / total_pop, 4),
+            "weight": shares["65+"],
         },
     ]
 
@@ -202,34 +201,27 @@ def make_us_toothpaste() -> Dict:
     }
 
 
+@cache
 def make_us_backpack() -> Dict:
     college_vars = ["B14004_005E", "B14004_010E", "B14004_021E", "B14004_026E"]
-    college_totals = fetch_census(college_vars)
-    campus_total = sum(college_totals.values())
-
     income_vars = [
         "B19037_029E", "B19037_030E", "B19037_031E",
         "B19037_032E", "B19037_033E", "B19037_034E", "B19037_035E",
     ]
-    income_totals = fetch_census(["B19037_019E"] + income_vars)
-    mid_income = (
-        income_totals["B19037_029E"]
-        + income_totals["B19037_030E"]
-        + income_totals["B19037_031E"]
-    )
-    high_income = (
-        income_totals["B19037_032E"]
-        + income_totals["B19037_033E"]
-        + income_totals["B19037_034E"]
-        + income_totals["B19037_035E"]
-    )
+    totals = fetch_census(college_vars + ["B19037_019E"] + income_vars)
+    campus_total = sum(totals[: len(college_vars)])
+    # Skip the B19037_019E householder total; the next three bins are
+    # $50k-$99k and the remaining four are $100k+.
+    income_totals = totals[len(college_vars) + 1 :]
+    mid_income = sum(income_totals[:3])
+    high_income = sum(income_totals[3:])
 
     segments = {
         "Campus": campus_total,
         "MidIncome": mid_income,
         "HighIncome": high_income,
     }
-    total = sum(segments.values())
+    shares = normalized_shares(segments)
 
     personas = [
         {
@@ -257,7 +249,7 @@ def make_us_backpack() -> Dict:
             "pain_points": ["straps fray under heavy textbooks"],
             "preferred_channels": ["Campus bookstores", "Online marketplaces"],
             "notes": "Responds to student discounts and bundle deals with accessories.",
-            "weight": round(segments["Campus"] / total, 4),
+            "weight": shares["Campus"],
         },
         {
             "name": "Outdoor Weekenders",
@@ -285,7 +277,7 @@ def make_us_backpack() -> Dict:
             "pain_points": ["dislikes bags that lack water resistance"],
             "preferred_channels": ["Sporting goods chains", "Brand outlet stores"],
             "notes": "Prefers earth-tone palettes and modular add-ons.",
-            "weight": round(segments["MidIncome"] / total, 4),
+            "weight": shares["MidIncome"],
         },
         {
             "name": "Minimalist Professionals",
@@ -316,7 +308,7 @@ def make_us_backpack() -> Dict:
             "pain_points": ["rejects noisy branding or bulky silhouettes"],
             "preferred_channels": ["Direct brand websites", "Boutique tech retailers"],
             "notes": "Will pay extra for recycled materials and lifetime guarantees.",
-            "weight": round(segments["HighIncome"] / total, 4),
+            "weight": shares["HighIncome"],
         },
     ]
 
@@ -332,15 +324,16 @@ def make_us_backpack() -> Dict:
     }
 
 
+@cache
 def make_us_portable_storage() -> Dict:
     internet_vars = ["B28002_006E", "B28002_008E", "B28002_013E"]
-    internet_totals = fetch_census(internet_vars)
+    cell_only, broadband_cable, no_internet = fetch_census(internet_vars)
     segments = {
-        "CellOnly": internet_totals["B28002_006E"],
-        "BroadbandCable": internet_totals["B28002_008E"],
-        "NoInternet": internet_totals["B28002_013E"],
+        "CellOnly": cell_only,
+        "BroadbandCable": broadband_cable,
+        "NoInternet": no_internet,
     }
-    total = sum(segments.values())
+    shares = normalized_shares(segments)
 
     personas = [
         {
@@ -368,7 +361,7 @@ def make_us_portable_storage() -> Dict:
             "pain_points": ["limited by mobile data throttling"],
             "preferred_channels": ["Big box electronics aisles", "Wireless carrier stores"],
             "notes": "Looks for bundles that include adapters across Android devices.",
-            "weight": round(segments["CellOnly"] / total, 4),
+            "weight": shares["CellOnly"],
         },
         {
             "name": "Broadband Power Users",
@@ -397,7 +390,7 @@ def make_us_portable_storage() -> Dict:
             ],
             "preferred_channels": ["Online specialty retailers", "Manufacturer direct stores"],
             "notes": "Interested in bundled cloud + hardware plans.",
-            "weight": round(segments["BroadbandCable"] / total, 4),
+            "weight": shares["BroadbandCable"],
         },
         {
             "name": "Offline Households",
@@ -424,7 +417,7 @@ def make_us_portable_storage() -> Dict:
             "pain_points": ["intimidated by complex setup instructions"],
             "preferred_channels": ["Local electronics shops", "Mail-order catalogs"],
             "notes": "Responds to phone support and easy-start guides.",
-            "weight": round(segments["NoInternet"] / total, 4),
+            "weight": shares["NoInternet"],
         },
     ]
 
@@ -441,15 +434,26 @@ def make_us_portable_storage() -> Dict:
 
 def write_yaml(defn: Dict, filename: str) -> None:
     path = DATA_DIR / filename
-    with path.open("w", encoding="utf-8") as fh:
-        yaml.safe_dump(defn, fh, sort_keys=False)
+    # Render into memory first so the file is written with a single call.
+    buffer = StringIO()
+    yaml.dump(defn, buffer, Dumper=_YamlDumper, sort_keys=False)
+    path.write_text(buffer.getvalue(), encoding="utf-8")
     print(f"Wrote {path}")
+    print(f"Wrote {write_sidecar(path)}")
 
 
 def main() -> None:
-    write_yaml(make_us_toothpaste(), "us_toothpaste.yml")
-    write_yaml(make_us_backpack(), "us_backpack_buyers.yml")
-    write_yaml(make_us_portable_storage(), "us_portable_storage_buyers.yml")
+    generators = [
+        (make_us_toothpaste, "us_toothpaste.yml"),
+        (make_us_backpack, "us_backpack_buyers.yml"),
+        (make_us_portable_storage, "us_portable_storage_buyers.yml"),
+    ]
+    with _CLIENT, ThreadPoolExecutor(max_workers=len(generators)) as executor:
+        futures = {
+            executor.submit(generator): filename for generator, filename in generators
+        }
+        for future in as_completed(futures):
+            write_yaml(future.result(), futures[future])
 
 
 if __name__ == "__main__":
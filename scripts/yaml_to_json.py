@@ -0,0 +1,43 @@
+#!/usr/bin/env python3
+"""Write JSON sidecars for anchor banks and persona groups.
+
+The loaders in ``ssr_service.anchors`` and ``ssr_service.personas`` read a
+``<name>.json`` file next to ``<name>.yml`` whenever the JSON copy is at least
+as new as the YAML, which skips YAML parsing entirely. Re-run this script after
+editing any YAML file (stale sidecars are ignored automatically).
+
+Usage:
+  python scripts/yaml_to_json.py [DIRECTORY ...]
+"""
+
+from __future__ import annotations
+
+import argparse
+from pathlib import Path
+
+from ssr_service.documents import write_sidecar
+
+DEFAULT_DIRECTORIES = (
+    Path("src/ssr_service/data/anchors"),
+    Path("src/ssr_service/data/personas"),
+)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Convert YAML data files to JSON")
+    parser.add_argument(
+        "directories",
+        nargs="*",
+        type=Path,
+        default=list(DEFAULT_DIRECTORIES),
+        help="Directories containing *.yml files",
+    )
+    args = parser.parse_args()
+
+    for directory in args.directories:
+        for path in sorted(directory.glob("*.yml")):
+            print(f"Wrote {write_sidecar(path)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -2,11 +2,13 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Iterable, List, Mapping
+from types import MappingProxyType
+from typing import Dict, Iterable, List, Mapping, Tuple
 
-import yaml
+from .documents import read_document
 
 
 @dataclass(slots=True)
@@ -15,11 +17,17 @@ class AnchorSet:
 
     id: str
     anchors: Mapping[int, str]
+    _sorted_items: Tuple[Tuple[int, str], ...] = field(
+        init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        self._sorted_items = tuple(sorted(self.anchors.items(), key=lambda item: item[0]))
 
-    def sorted_items(self) -> List[tuple[int, str]]:
+    def sorted_items(self) -> Tuple[Tuple[int, str], ...]:
         """Return anchors sorted by rating."""
 
-        return sorted(self.anchors.items(), key=lambda item: item[0])
+        return self._sorted_items
 
 
 @dataclass(slots=True)
@@ -30,20 +38,36 @@ class AnchorBank:
     intent: str
     locale: str
     anchor_sets: List[AnchorSet]
+    _ratings: Tuple[int, ...] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self._ratings = (
+            tuple(rating for rating, _ in self.anchor_sets[0].sorted_items())
+            if self.anchor_sets
+            else ()
+        )
 
     def ratings(self) -> Iterable[int]:
         """Return supported ratings."""
 
-        if not self.anchor_sets:
-            return []
-        return sorted(self.anchor_sets[0].anchors.keys())
+        return self._ratings
 
 
 def load_anchor_bank(path: Path) -> AnchorBank:
-    """Load anchor bank from YAML file."""
+    """Load anchor bank from YAML file.
+
+    Parsed banks are cached per path and modification time; the returned bank is
+    shared between callers and its anchor mappings are read-only.
+    """
+
+    return _load_anchor_bank_cached(str(path), path.stat().st_mtime_ns)
+
 
-    with path.open("r", encoding="utf-8") as fp:
-        raw = yaml.safe_load(fp)
+@lru_cache(maxsize=64)
+def _load_anchor_bank_cached(path_str: str, mtime_ns: int) -> AnchorBank:
+    _ = mtime_ns  # part of the cache key only
+    path = Path(path_str)
+    raw = read_document(path)
 
     version = str(raw["version"])
     intent = str(raw["intent"])
@@ -54,14 +78,16 @@ def load_anchor_bank(path: Path) -> AnchorBank:
         anchors_dict: Dict[int, str] = {
             int(k): str(v) for k, v in entry.get("anchors", {}).items()
         }
-        anchor_sets.append(AnchorSet(id=str(entry.get("id")), anchors=anchors_dict))
+        anchor_sets.append(
+            AnchorSet(id=str(entry.get("id")), anchors=MappingProxyType(anchors_dict))
+        )
 
     if not anchor_sets:
         raise ValueError(f"Anchor file {path} contains no anchor sets")
 
-    first_keys = set(anchor_sets[0].anchors.keys())
+    first_keys = frozenset(anchor_sets[0].anchors)
     for anchor_set in anchor_sets[1:]:
-        if set(anchor_set.anchors.keys()) != first_keys:
+        if anchor_set.anchors.keys() != first_keys:
             raise ValueError("Anchor sets must share identical rating keys")
 
     return AnchorBank(
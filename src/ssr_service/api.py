@@ -2,31 +2,42 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
 from contextlib import asynccontextmanager
-from typing import Any, Dict, List, Optional
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
 
 from fastapi import Depends, FastAPI, File, Form, HTTPException, Query, UploadFile
 from fastapi.middleware.cors import CORSMiddleware
 
-from .audience_builder import parse_evidence, synthesize_panel
+from .audience_builder import EvidenceContent, parse_evidence_async, synthesize_panel
 from .config import AppSettings, get_settings
 from .db import delete_run, get_run, init_db, list_runs, save_run
+from .http_client import create_http_client, set_http_client
 from .models import (
+    AudienceBuildResponse,
     PanelPreviewResponse,
     PersonaGroupSummary,
     SimulationRequest,
     SimulationResponse,
 )
 from .orchestrator import preview_panel, run_simulation
-from .personas import get_persona_library
+from .personas import LibraryStamp, get_persona_library, library_stamp
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    """Initialize database on startup."""
+    """Initialize the database and the shared upstream HTTP pool."""
     init_db()
-    yield
+    http_client = create_http_client()
+    app.state.http_client = http_client
+    set_http_client(http_client)
+    try:
+        yield
+    finally:
+        set_http_client(None)
+        await http_client.aclose()
 
 
 app = FastAPI(
@@ -41,8 +52,10 @@ app.add_middleware(
     CORSMiddleware,  # ty: ignore[invalid-argument-type]
     allow_origins=app_settings.cors_allow_origins,
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    # Explicit lists (matching what web_ui sends) let Starlette answer preflight
+    # requests from precomputed headers instead of echoing wildcard requests.
+    allow_methods=["GET", "POST", "DELETE"],
+    allow_headers=["content-type", "authorization"],
 )
 
 
@@ -65,15 +78,18 @@ async def simulate(request: SimulationRequest) -> SimulationResponse:
         label_parts.append(f"n={response.aggregate.sample_n}")
         label = " · ".join(label_parts) if label_parts else None
 
-        run_id = save_run(
-            request_data=request.model_dump(mode="json"),
-            response_data=response.model_dump(mode="json"),
+        # SQLite I/O runs on a worker thread so the event loop keeps serving.
+        run_id = await asyncio.to_thread(
+            save_run,
+            request_data=request.model_dump_json(),
+            response_data=response.model_dump_json(),
             label=label,
         )
-        # Inject the run_id into metadata for client convenience
-        response.metadata["run_id"] = run_id
-
-        return response
+        # Return a copy carrying the run_id for client convenience; the stored
+        # response stays as it was persisted.
+        return response.model_copy(
+            update={"metadata": {**response.metadata, "run_id": run_id}}
+        )
     except (ValueError, RuntimeError) as exc:
         logging.error("Simulation error: %s", exc, exc_info=True)
         raise HTTPException(status_code=400, detail=str(exc)) from exc
@@ -94,14 +110,23 @@ async def panel_preview(request: SimulationRequest) -> PanelPreviewResponse:
         raise HTTPException(status_code=500, detail="Internal server error") from exc
 
 
+# Persona group summaries keyed by library path, stamped with the YAML file mtimes.
+_summaries_cache: Dict[Path, Tuple[LibraryStamp, List[PersonaGroupSummary]]] = {}
+
+
 @app.get("/persona-groups", response_model=list[PersonaGroupSummary])
 async def persona_groups(
     settings: AppSettings = Depends(get_settings),
 ) -> list[PersonaGroupSummary]:
+    library_path = Path(settings.persona_library_path)
+    stamp = library_stamp(library_path)
+    cached = _summaries_cache.get(library_path)
+    if cached is not None and cached[0] == stamp:
+        return cached[1]
+
     library = get_persona_library(settings.persona_library_path)
-    groups = list(library.groups().values())
-    groups.sort(key=lambda group: group.name)
-    return [
+    groups = sorted(library.groups().values(), key=lambda group: group.name)
+    summaries = [
         PersonaGroupSummary(
             name=group.name,
             description=group.description,
@@ -110,15 +135,19 @@ async def persona_groups(
         )
         for group in groups
     ]
+    _summaries_cache[library_path] = (stamp, summaries)
+    return summaries
 
 
 # ============================================================================
 # Run History Endpoints
 # ============================================================================
+# These are plain ``def`` handlers: the database layer is synchronous SQLite,
+# so FastAPI runs them in its threadpool instead of on the event loop.
 
 
 @app.get("/runs")
-async def get_runs(
+def get_runs(
     limit: int = Query(default=50, ge=1, le=200),
     offset: int = Query(default=0, ge=0),
 ) -> List[Dict[str, Any]]:
@@ -127,7 +156,7 @@ async def get_runs(
 
 
 @app.get("/runs/{run_id}")
-async def get_run_by_id(run_id: str) -> Dict[str, Any]:
+def get_run_by_id(run_id: str) -> Dict[str, Any]:
     """Get a specific run by ID, including full request and response."""
     result = get_run(run_id)
     if result is None:
@@ -136,7 +165,7 @@ async def get_run_by_id(run_id: str) -> Dict[str, Any]:
 
 
 @app.delete("/runs/{run_id}")
-async def delete_run_by_id(run_id: str) -> Dict[str, str]:
+def delete_run_by_id(run_id: str) -> Dict[str, str]:
     """Delete a specific run by ID."""
     deleted = delete_run(run_id)
     if not deleted:
@@ -151,11 +180,15 @@ async def delete_run_by_id(run_id: str) -> Dict[str, str]:
 
 
 
-@app.post("/audience/build")
+@app.post(
+    "/audience/build",
+    response_model=AudienceBuildResponse,
+    response_model_by_alias=False,
+)
 async def build_audience(
     files: List[UploadFile] = File(...),
     target_description: Optional[str] = Form(default=None),
-) -> Dict[str, Any]:
+) -> AudienceBuildResponse:
     """Build a PopulationSpec from uploaded evidence files.
 
     Accepts CSV, PDF, JSON, or text files. Returns a PopulationSpec
@@ -164,23 +197,23 @@ async def build_audience(
     if not files:
         raise HTTPException(status_code=400, detail="At least one file is required")
 
-    # Parse all uploaded files
-    file_contents: List[tuple[str, bytes | str]] = []
-    for upload in files:
-        content = await upload.read()
-        file_contents.append((upload.filename or "unknown", content))
+    # Hand the spooled upload files to the parsers, which read them in worker
+    # threads (and only as far as each summarizer needs).
+    file_contents: List[tuple[str, EvidenceContent]] = [
+        (upload.filename or "unknown", upload.file) for upload in files
+    ]
 
     try:
-        evidence_summary = parse_evidence(file_contents)
+        evidence_summary = await parse_evidence_async(file_contents)
         spec, reasoning = await synthesize_panel(
             evidence_summary=evidence_summary,
             target_description=target_description,
         )
-        return {
-            "population_spec": spec.model_dump(mode="json"),
-            "reasoning": reasoning,
-            "evidence_summary_length": len(evidence_summary),
-        }
+        return AudienceBuildResponse(
+            population_spec=spec,
+            reasoning=reasoning,
+            evidence_summary_length=len(evidence_summary),
+        )
     except ValueError as exc:
         logging.error("Audience build error: %s", exc, exc_info=True)
         raise HTTPException(status_code=400, detail=str(exc)) from exc
@@ -7,45 +7,120 @@ This module provides:
 
 from __future__ import annotations
 
+import asyncio
 import csv
-import importlib
 import io
 import json
 import logging
+import re
+from contextlib import closing
+from functools import lru_cache
+from importlib import import_module
+from itertools import islice
 from pathlib import Path
-from typing import List, Optional, Tuple
+from types import ModuleType
+from typing import BinaryIO, Generator, List, Optional, Sequence, Tuple, Union
+
+import httpx
+import orjson
 
 from .config import AppSettings, get_settings
+from .http_client import get_http_client
 from .models import (
     PersonaInjection,
     PersonaSpec,
     PopulationSpec,
 )
 
+
+def _optional_module(name: str) -> Optional[ModuleType]:
+    """Import ``name`` if it is installed, else return ``None``."""
+    try:
+        return import_module(name)
+    except ImportError:
+        return None
+
+
+# Optional PDF and CSV backends are resolved once at import rather than per upload.
+_fitz = _optional_module("fitz")
+_FITZ_OPEN = _fitz.open if _fitz is not None else None
+_PDF_OPEN = getattr(_optional_module("pdfplumber"), "open", None)
+_pa = _optional_module("pyarrow")
+_pc = _optional_module("pyarrow.compute")
+_pacsv = _optional_module("pyarrow.csv")
+
 logger = logging.getLogger(__name__)
 
 # ============================================================================
 # Multi-Format Parser
 # ============================================================================
 
+EvidenceContent = Union[bytes, str, BinaryIO]
+
+
+_JSON_MAX_CHARS = 200_000
+_TEXT_MAX_CHARS = 5000
+
+
+def _csv_samples_arrow(
+    content: str, max_rows: int
+) -> Tuple[int, List[str], List[List[str]]]:
+    if _pa is None or _pc is None or _pacsv is None:
+        raise RuntimeError("pyarrow is not installed")
+    # Read every column as a string so samples match the source text verbatim.
+    header = next(csv.reader(io.StringIO(content)), [])
+    table = _pacsv.read_csv(
+        _pa.BufferReader(content.encode("utf-8")),
+        read_options=_pacsv.ReadOptions(block_size=1 << 20),
+        convert_options=_pacsv.ConvertOptions(
+            column_types={name: _pa.string() for name in header}
+        ),
+    ).slice(0, max_rows)
+    columns = table.column_names
+    samples = [
+        [value for value in _pc.unique(table.column(index)).to_pylist() if value][:10]
+        for index in range(min(10, table.num_columns))
+    ]
+    return table.num_rows, columns, samples
+
+
+def _csv_samples_stdlib(
+    content: str, max_rows: int
+) -> Tuple[int, List[str], List[List[str]]]:
+    reader = csv.reader(io.StringIO(content))
+    columns = next(reader, [])
+    # Positional rows avoid a dict per row; blank lines are skipped like DictReader.
+    rows = list(islice(filter(None, reader), max_rows))
+    if not rows:
+        return 0, [], []
+    samples = [
+        list({row[j] for row in rows if j < len(row) and row[j]})[:10]
+        for j in range(min(10, len(columns)))
+    ]
+    return len(rows), columns, samples
+
 
 def _summarize_csv(content: str, filename: str, max_rows: int = 50) -> str:
     """Parse CSV content and return a text summary."""
     try:
-        reader = csv.DictReader(io.StringIO(content))
-        rows = list(reader)[:max_rows]
-        if not rows:
+        row_count: int | None = None
+        if _pa is not None:
+            try:
+                row_count, columns, samples = _csv_samples_arrow(content, max_rows)
+            except _pa.ArrowInvalid:
+                row_count = None  # e.g. ragged rows; the csv module is more lenient
+        if row_count is None:
+            row_count, columns, samples = _csv_samples_stdlib(content, max_rows)
+        if not row_count:
             return f"[{filename}] Empty CSV file."
 
-        columns = list(rows[0].keys())
         summary_parts = [
-            f"[{filename}] CSV with {len(rows)} rows (showing up to {max_rows}).",
+            f"[{filename}] CSV with {row_count} rows (showing up to {max_rows}).",
             f"Columns: {', '.join(columns)}",
         ]
 
-        # Provide a sample of unique values per column
-        for col in columns[:10]:  # Limit to first 10 columns
-            values = list({row.get(col, "") for row in rows if row.get(col)})[:10]
+        # Provide a sample of unique values per column (first 10 columns)
+        for col, values in zip(columns, samples):
             if values:
                 summary_parts.append(f"  - {col}: {', '.join(str(v) for v in values)}")
 
@@ -54,13 +129,69 @@ def _summarize_csv(content: str, filename: str, max_rows: int = 50) -> str:
         return f"[{filename}] Failed to parse CSV: {e}"
 
 
-def _summarize_json(content: str, filename: str) -> str:
-    """Parse JSON content and return a text summary."""
+_JSON_DECODER = json.JSONDecoder()
+# JSON insignificant whitespace (RFC 8259).
+_JSON_WS = re.compile(r"[ \t\n\r]*")
+
+
+def _skip_json_ws(content: str, idx: int) -> int:
+    match = _JSON_WS.match(content, idx)
+    return match.end() if match else idx
+
+
+def _leading_array_items(content: str, count: int) -> Optional[List[object]]:
+    """Decode up to ``count`` leading items of a JSON array without parsing the rest.
+
+    Returns ``None`` when ``content`` is not an array; raises ``ValueError`` on
+    malformed input before the requested items are complete.
+    """
+    idx = _skip_json_ws(content, 0)
+    if not content.startswith("[", idx):
+        return None
+    idx = _skip_json_ws(content, idx + 1)
+    items: List[object] = []
+    if content.startswith("]", idx):
+        return items
+    while len(items) < count:
+        item, idx = _JSON_DECODER.raw_decode(content, idx)
+        items.append(item)
+        idx = _skip_json_ws(content, idx)
+        if content.startswith("]", idx):
+            break
+        if not content.startswith(",", idx):
+            raise ValueError(f"Expected ',' or ']' at position {idx}")
+        idx = _skip_json_ws(content, idx + 1)
+    return items
+
+
+def _summarize_json(content: str, filename: str, max_chars: int = _JSON_MAX_CHARS) -> str:
+    """Parse JSON content and return a text summary.
+
+    For documents larger than ``max_chars`` only the leading items of a top-level
+    array are decoded; anything else is summarized as text, so the tail is never
+    parsed or re-encoded.
+    """
+    if len(content) > max_chars:
+        try:
+            items = _leading_array_items(content, 10)
+            if items is not None:
+                sample = orjson.dumps(items, option=orjson.OPT_INDENT_2).decode()
+                return (
+                    f"[{filename}] JSON array (first {len(items)} items shown; "
+                    f"too large to count). Sample:\n{sample}"
+                )
+        except (ValueError, TypeError):
+            pass
+        return _summarize_text(content, filename)
+
+    try:
+        data = orjson.loads(content)
+    except Exception as e:  # noqa: BLE001
+        return f"[{filename}] Failed to parse JSON: {e}"
     try:
-        data = json.loads(content)
         if isinstance(data, list):
-            sample = data[:10]
-            return f"[{filename}] JSON array with {len(data)} items. Sample:\n{json.dumps(sample, indent=2)}"
+            sample = orjson.dumps(data[:10], option=orjson.OPT_INDENT_2).decode()
+            return f"[{filename}] JSON array with {len(data)} items. Sample:\n{sample}"
         elif isinstance(data, dict):
             keys = list(data.keys())[:20]
             return f"[{filename}] JSON object with keys: {', '.join(keys)}"
@@ -70,66 +201,162 @@ def _summarize_json(content: str, filename: str) -> str:
         return f"[{filename}] Failed to parse JSON: {e}"
 
 
-def _summarize_text(content: str, filename: str, max_chars: int = 5000) -> str:
+def _summarize_text(content: str, filename: str, max_chars: int = _TEXT_MAX_CHARS) -> str:
     """Return text content, truncated if too long."""
     if len(content) > max_chars:
         return f"[{filename}] Text (truncated to {max_chars} chars):\n{content[:max_chars]}..."
     return f"[{filename}] Text:\n{content}"
 
 
+_PDF_MAX_PAGES = 10
+_PDF_MAX_CHARS = 8000
+
+
+def _pymupdf_pages(doc, max_pages: int) -> Generator[str, None, None]:
+    try:
+        for index in range(min(max_pages, doc.page_count)):
+            yield doc[index].get_text("text", sort=True)
+    finally:
+        doc.close()
+
+
+def _pdfplumber_pages(pdf, max_pages: int) -> Generator[str, None, None]:
+    with pdf:
+        for page in pdf.pages[:max_pages]:
+            yield page.extract_text() or ""
+
+
+def _pdf_page_texts(
+    content: bytes, max_pages: int
+) -> Optional[Generator[str, None, None]]:
+    """Return a lazy per-page text iterator, or ``None`` if no PDF backend is installed.
+
+    PyMuPDF is much faster than pdfplumber (pdfminer.six); pdfplumber stays as a
+    fallback for environments that only have the older extra installed.
+    """
+    if _FITZ_OPEN is not None:
+        return _pymupdf_pages(_FITZ_OPEN(stream=content, filetype="pdf"), max_pages)
+    if _PDF_OPEN is not None:
+        return _pdfplumber_pages(_PDF_OPEN(io.BytesIO(content)), max_pages)
+    return None
+
+
 def _summarize_pdf(content: bytes, filename: str) -> str:
-    """Extract text from PDF bytes. Requires pdfplumber or falls back gracefully."""
+    """Extract text from PDF bytes. Requires PyMuPDF or pdfplumber or falls back gracefully."""
     try:
-        pdfplumber = importlib.import_module("pdfplumber")
-        open_pdf = getattr(pdfplumber, "open", None)
-        if open_pdf is None:  # pragma: no cover - runtime guard
-            raise ImportError("pdfplumber.open is unavailable")
-
-        with open_pdf(io.BytesIO(content)) as pdf:
-            text_parts = []
-            for i, page in enumerate(pdf.pages[:10]):  # Limit to first 10 pages
-                page_text = page.extract_text() or ""
-                text_parts.append(f"[Page {i + 1}]\n{page_text}")
-            combined = "\n\n".join(text_parts)
-            if len(combined) > 8000:
-                combined = combined[:8000] + "..."
-            return f"[{filename}] PDF content:\n{combined}"
-    except ImportError:
-        return f"[{filename}] PDF parsing requires pdfplumber. Install with: pip install pdfplumber"
+        pages = _pdf_page_texts(content, _PDF_MAX_PAGES)
+        if pages is None:
+            return f"[{filename}] PDF parsing requires PyMuPDF or pdfplumber. Install with: pip install pymupdf"
+
+        # Pages are extracted lazily so layout analysis stops once the cap is hit.
+        text_parts: List[str] = []
+        total = 0
+        with closing(pages):
+            for i, page_text in enumerate(pages):
+                part = f"[Page {i + 1}]\n{page_text}"
+                total += len(part) + (2 if text_parts else 0)
+                text_parts.append(part)
+                if total > _PDF_MAX_CHARS:
+                    break
+
+        combined = "\n\n".join(text_parts)
+        if len(combined) > _PDF_MAX_CHARS:
+            combined = combined[:_PDF_MAX_CHARS] + "..."
+        return f"[{filename}] PDF content:\n{combined}"
     except Exception as e:  # noqa: BLE001
         return f"[{filename}] Failed to parse PDF: {e}"
 
 
+def _char_limit(ext: str) -> Optional[int]:
+    """Characters a summarizer can use for ``ext``, or ``None`` if it needs everything."""
+    if ext in (".csv", ".pdf"):
+        return None
+    return _JSON_MAX_CHARS if ext == ".json" else _TEXT_MAX_CHARS
+
+
+def _decode_prefix(data: bytes, max_chars: int) -> str:
+    """Decode just enough UTF-8 to cover ``max_chars + 1`` characters.
+
+    A UTF-8 character is at most 4 bytes, so that many bytes always hold the
+    requested prefix; the extra character tells the summarizer to truncate.
+    """
+    head = memoryview(data)[: (max_chars + 1) * 4]
+    return str(head, "utf-8", "replace")[: max_chars + 1]
+
+
+def _read_upload(stream: BinaryIO, ext: str) -> bytes:
+    """Read only as much of an uploaded file as its summarizer can use."""
+    limit = _char_limit(ext)
+    if limit is None:
+        return stream.read()
+    return stream.read((limit + 1) * 4)
+
+
+def _parse_one(filename: str, content: EvidenceContent) -> str:
+    """Summarize a single evidence file, dispatching on its extension."""
+    ext = Path(filename).suffix.lower()
+    if not isinstance(content, (bytes, str)):
+        content = _read_upload(content, ext)
+
+    if ext == ".pdf":
+        byte_content = content if isinstance(content, bytes) else content.encode("utf-8")
+        return _summarize_pdf(byte_content, filename)
+
+    limit = _char_limit(ext)
+    if isinstance(content, str):
+        text_content = content
+    elif limit is None:
+        text_content = content.decode("utf-8", errors="replace")
+    else:
+        text_content = _decode_prefix(content, limit)
+
+    if ext == ".csv":
+        return _summarize_csv(text_content, filename)
+    elif ext == ".json":
+        return _summarize_json(text_content, filename)
+    else:
+        # Treat as plain text
+        return _summarize_text(text_content, filename)
+
+
 def parse_evidence(
-    files: List[Tuple[str, bytes | str]],
+    files: Sequence[Tuple[str, EvidenceContent]],
 ) -> str:
     """Parse a list of evidence files and return a combined text summary.
 
     Args:
-        files: List of (filename, content) tuples. Content can be bytes (for PDF)
-               or str (for text-based formats).
+        files: Sequence of (filename, content) tuples. Content can be bytes (for PDF),
+               str (for text-based formats), or a binary file object such as an
+               upload's spooled file, which is read lazily.
 
     Returns:
         A combined text summary of all parsed files.
     """
-    summaries = []
-    for filename, content in files:
-        ext = Path(filename).suffix.lower()
-
-        if ext == ".csv":
-            text_content = content if isinstance(content, str) else content.decode("utf-8", errors="replace")
-            summaries.append(_summarize_csv(text_content, filename))
-        elif ext == ".json":
-            text_content = content if isinstance(content, str) else content.decode("utf-8", errors="replace")
-            summaries.append(_summarize_json(text_content, filename))
-        elif ext == ".pdf":
-            byte_content = content if isinstance(content, bytes) else content.encode("utf-8")
-            summaries.append(_summarize_pdf(byte_content, filename))
-        else:
-            # Treat as plain text
-            text_content = content if isinstance(content, str) else content.decode("utf-8", errors="replace")
-            summaries.append(_summarize_text(text_content, filename))
+    return "\n\n---\n\n".join(
+        _parse_one(filename, content) for filename, content in files
+    )
+
+
+_PARSE_CONCURRENCY = 4
+
 
+async def parse_evidence_async(
+    files: Sequence[Tuple[str, EvidenceContent]],
+) -> str:
+    """Like :func:`parse_evidence`, but parses files concurrently off the event loop.
+
+    At most ``_PARSE_CONCURRENCY`` files are parsed at once; summaries keep the
+    order of ``files``.
+    """
+    semaphore = asyncio.Semaphore(_PARSE_CONCURRENCY)
+
+    async def parse(filename: str, content: EvidenceContent) -> str:
+        async with semaphore:
+            return await asyncio.to_thread(_parse_one, filename, content)
+
+    summaries = await asyncio.gather(
+        *(parse(filename, content) for filename, content in files)
+    )
     return "\n\n---\n\n".join(summaries)
 
 
@@ -177,6 +404,36 @@ Rules:
 """
 
 
+@lru_cache(maxsize=4)
+def _pooled_synthesis_client(
+    api_key: str, base_url: Optional[str], http_client: httpx.AsyncClient
+):
+    from openai import AsyncOpenAI
+
+    # openai annotates http_client as httpx2.AsyncClient but accepts httpx's.
+    return AsyncOpenAI(
+        api_key=api_key,
+        base_url=base_url,
+        http_client=http_client,  # ty: ignore[invalid-argument-type]
+    )
+
+
+def _synthesis_client(api_key: str, base_url: Optional[str]):
+    """Return an AsyncOpenAI client for audience synthesis.
+
+    Clients bound to the shared pool are reused so audience builds share
+    keep-alive connections. Without a registered pool a fresh client is built:
+    the SDK's own pool is tied to the event loop of the call that created it.
+    """
+    http_client = get_http_client()
+    if http_client is not None:
+        return _pooled_synthesis_client(api_key, base_url, http_client)
+
+    from openai import AsyncOpenAI
+
+    return AsyncOpenAI(api_key=api_key, base_url=base_url)
+
+
 async def synthesize_panel(
     evidence_summary: str,
     target_description: Optional[str] = None,
@@ -209,12 +466,7 @@ async def synthesize_panel(
 
     # Use the provider's underlying client to make a structured call
     try:
-        from openai import AsyncOpenAI
-
-        client = AsyncOpenAI(
-            api_key=settings.openai_api_key,
-            base_url=base_url,
-        )
+        client = _synthesis_client(settings.openai_api_key, base_url)
 
         response = await client.chat.completions.create(
             model=settings.openai_responses_model,
@@ -262,4 +514,9 @@ async def synthesize_panel(
     return spec, reasoning
 
 
-__all__ = ["parse_evidence", "synthesize_panel"]
+__all__ = [
+    "EvidenceContent",
+    "parse_evidence",
+    "parse_evidence_async",
+    "synthesize_panel",
+]
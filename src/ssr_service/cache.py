@@ -3,24 +3,55 @@
 from __future__ import annotations
 
 import hashlib
-from typing import Dict, Optional
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional, Tuple
 
-_CACHE: Dict[str, str] = {}
+from .config import get_settings
+
+# Key -> (expiry on the monotonic clock, response), least recently used first.
+_CACHE: OrderedDict[str, Tuple[float, str]] = OrderedDict()
+_LOCK = threading.Lock()
 
 
 def get_from_cache(prompt: str, *, namespace: str = "") -> Optional[str]:
     """Get a response from the cache."""
     key = _get_key(prompt, namespace=namespace)
-    return _CACHE.get(key)
+    with _LOCK:
+        entry = _CACHE.get(key)
+        if entry is None:
+            return None
+        expires_at, response = entry
+        if expires_at <= time.monotonic():
+            del _CACHE[key]
+            return None
+        _CACHE.move_to_end(key)
+        return response
 
 
 def add_to_cache(prompt: str, response: str, *, namespace: str = "") -> None:
-    """Add a response to the cache."""
+    """Add a response to the cache, evicting the least recently used entries."""
     key = _get_key(prompt, namespace=namespace)
-    _CACHE[key] = response
+    settings = get_settings()
+    expires_at = time.monotonic() + settings.llm_cache_ttl_seconds
+    with _LOCK:
+        _CACHE[key] = (expires_at, response)
+        _CACHE.move_to_end(key)
+        while len(_CACHE) > settings.llm_cache_max_entries:
+            _CACHE.popitem(last=False)
 
 
 def _get_key(prompt: str, *, namespace: str = "") -> str:
-    """Get the cache key for a prompt."""
-    payload = f"{namespace}\n{prompt}" if namespace else prompt
-    return hashlib.sha256(payload.encode()).hexdigest()
+    """Get the cache key for a prompt.
+
+    Keys only index an in-process dict, so BLAKE2b (128-bit) is used instead of
+    SHA-256. Components are fed to the hasher separately so the prompt is never
+    copied into a combined namespace string first.
+    """
+    hasher = hashlib.blake2b(digest_size=16)
+    if namespace:
+        hasher.update(namespace.encode())
+        hasher.update(b"\n")
+    hasher.update(prompt.encode())
+    return hasher.hexdigest()
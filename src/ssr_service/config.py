@@ -33,6 +33,11 @@ class AppSettings(BaseSettings):
     max_concurrency: int = Field(default=64, ge=1, le=512)
     default_sample_size: int = Field(default=200, ge=1)
 
+    llm_cache_max_entries: int = Field(default=10_000, ge=1)
+    llm_cache_ttl_seconds: float = Field(default=86_400.0, gt=0)
+    # Attach the SDK response object to each LLMResponse (debugging only).
+    keep_raw_responses: bool = Field(default=False, alias="SSR_KEEP_RAW")
+
     anchor_bank_path: str = Field(default="src/ssr_service/data/anchors")
     persona_library_path: str = Field(default="src/ssr_service/data/personas")
 
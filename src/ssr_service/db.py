@@ -1,18 +1,29 @@
 """Database layer for persisting simulation runs.
 
-Uses SQLAlchemy with aiosqlite for async SQLite access.
+Uses synchronous SQLAlchemy over SQLite; async callers run these functions on
+a worker thread (FastAPI's threadpool or ``asyncio.to_thread``).
 Schema is designed to be easily migratable to PostgreSQL.
 """
 
 from __future__ import annotations
 
-import json
 import uuid
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, List, Optional, cast
-
-from sqlalchemy import Column, DateTime, String, Text, create_engine, desc
+from typing import Any, Dict, Iterable, List, Optional, TypedDict, cast
+
+import orjson
+from sqlalchemy import (
+    Column,
+    DateTime,
+    Index,
+    String,
+    Text,
+    create_engine,
+    desc,
+    event,
+    insert,
+)
 from sqlalchemy.orm import Session, declarative_base, sessionmaker
 
 from .config import get_settings
@@ -32,6 +43,9 @@ class RunRecord(Base):
     request_json = Column(Text, nullable=False)
     response_json = Column(Text, nullable=False)
 
+    # Lets list_runs walk runs newest-first without sorting the whole table.
+    __table_args__ = (Index("ix_runs_created_at_desc", created_at.desc()),)
+
     def to_dict(self) -> Dict[str, Any]:
         return {
             "id": self.id,
@@ -44,8 +58,8 @@ class RunRecord(Base):
         result = self.to_dict()
         request_json = cast(Optional[str], self.request_json)
         response_json = cast(Optional[str], self.response_json)
-        result["request"] = json.loads(request_json) if request_json else None
-        result["response"] = json.loads(response_json) if response_json else None
+        result["request"] = orjson.loads(request_json) if request_json else None
+        result["response"] = orjson.loads(response_json) if response_json else None
         return result
 
 
@@ -61,12 +75,29 @@ def get_db_path() -> Path:
     return db_dir / "runs.db"
 
 
+def _configure_sqlite(dbapi_connection: Any, _connection_record: Any) -> None:
+    # WAL lets readers proceed during writes and, with synchronous=NORMAL,
+    # commits no longer fsync on every run saved.
+    cursor = dbapi_connection.cursor()
+    try:
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.execute("PRAGMA temp_store=MEMORY")
+        cursor.execute("PRAGMA mmap_size=268435456")
+    finally:
+        cursor.close()
+
+
 def init_db() -> None:
     """Initialize the database, creating tables if they don't exist."""
     global _engine, _Session
     db_path = get_db_path()
     _engine = create_engine(f"sqlite:///{db_path}", echo=False)
+    event.listen(_engine, "connect", _configure_sqlite)
     Base.metadata.create_all(_engine)
+    # create_all skips indexes on tables that already exist; add any new ones.
+    for index in RunRecord.__table__.indexes:
+        index.create(_engine, checkfirst=True)
     _Session = sessionmaker(bind=_engine)
 
 
@@ -80,14 +111,24 @@ def get_session() -> Session:
     return _Session()
 
 
+def _as_json_text(data: Dict[str, Any] | str) -> str:
+    if isinstance(data, str):
+        return data
+    # OPT_NON_STR_KEYS mirrors json.dumps, which stringifies int/float keys.
+    return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS).decode()
+
+
 def save_run(
-    request_data: Dict[str, Any],
-    response_data: Dict[str, Any],
+    request_data: Dict[str, Any] | str,
+    response_data: Dict[str, Any] | str,
     label: Optional[str] = None,
     status: str = "completed",
 ) -> str:
     """Save a simulation run to the database.
 
+    ``request_data`` and ``response_data`` may be dicts or already-encoded JSON
+    strings (e.g. from ``model_dump_json``), which are stored as-is.
+
     Returns the run ID.
     """
     session = get_session()
@@ -97,8 +138,8 @@ def save_run(
             id=run_id,
             label=label,
             status=status,
-            request_json=json.dumps(request_data),
-            response_json=json.dumps(response_data),
+            request_json=_as_json_text(request_data),
+            response_json=_as_json_text(response_data),
         )
         session.add(record)
         session.commit()
@@ -107,6 +148,49 @@ def save_run(
         session.close()
 
 
+class _RunPayload(TypedDict):
+    request_data: Dict[str, Any] | str
+    response_data: Dict[str, Any] | str
+
+
+class RunData(_RunPayload, total=False):
+    """One run for :func:`save_runs`; fields mirror :func:`save_run`'s arguments."""
+
+    label: Optional[str]
+    status: str
+
+
+def save_runs(runs: Iterable[RunData]) -> List[str]:
+    """Save several runs with one executemany INSERT in a single transaction.
+
+    Returns the run IDs in input order.
+    """
+    run_ids: List[str] = []
+    rows: List[Dict[str, Any]] = []
+    for run in runs:
+        run_id = str(uuid.uuid4())
+        run_ids.append(run_id)
+        rows.append(
+            {
+                "id": run_id,
+                "created_at": datetime.now(timezone.utc),
+                "label": run.get("label"),
+                "status": run.get("status", "completed"),
+                "request_json": _as_json_text(run["request_data"]),
+                "response_json": _as_json_text(run["response_data"]),
+            }
+        )
+    if not rows:
+        return []
+    session = get_session()
+    try:
+        session.execute(insert(RunRecord), rows)
+        session.commit()
+        return run_ids
+    finally:
+        session.close()
+
+
 def list_runs(limit: int = 50, offset: int = 0) -> List[Dict[str, Any]]:
     """List simulation runs, most recent first."""
     session = get_session()
@@ -149,4 +233,13 @@ def delete_run(run_id: str) -> bool:
         session.close()
 
 
-__all__ = ["init_db", "save_run", "list_runs", "get_run", "delete_run", "RunRecord"]
+__all__ = [
+    "init_db",
+    "save_run",
+    "RunData",
+    "save_runs",
+    "list_runs",
+    "get_run",
+    "delete_run",
+    "RunRecord",
+]
@@ -0,0 +1,55 @@
+"""YAML data-file loading shared by the anchor and persona libraries."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Any, TextIO, Union
+
+import orjson
+import yaml
+
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # pragma: no cover - LibYAML not available
+    from yaml import SafeLoader as _YamlLoader
+
+
+def load_yaml(source: Union[bytes, str, TextIO]) -> Any:
+    """Parse YAML with the LibYAML safe loader when available."""
+
+    # _YamlLoader is a SafeLoader variant, which bandit cannot see through the alias.
+    return yaml.load(source, Loader=_YamlLoader)  # nosec B506
+
+
+def sidecar_path(path: Path) -> Path:
+    """Location of the JSON copy of the YAML file at ``path``."""
+
+    return path.with_suffix(".json")
+
+
+def read_document(path: Path) -> Any:
+    """Parse ``path``, preferring an up-to-date JSON sidecar over the YAML source."""
+
+    sidecar = sidecar_path(path)
+    try:
+        if sidecar.stat().st_mtime_ns >= path.stat().st_mtime_ns:
+            return orjson.loads(sidecar.read_bytes())
+    except FileNotFoundError:
+        pass
+    with path.open("r", encoding="utf-8") as fp:
+        return load_yaml(fp)
+
+
+def write_sidecar(path: Path) -> Path:
+    """Write the JSON sidecar that ``read_document`` prefers for ``path``."""
+
+    with path.open("r", encoding="utf-8") as fp:
+        payload = load_yaml(fp)
+    target = sidecar_path(path)
+    target.write_bytes(
+        orjson.dumps(payload, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    )
+    return target
+
+
+__all__ = ["load_yaml", "read_document", "sidecar_path", "write_sidecar"]
@@ -6,11 +6,23 @@ import asyncio
 from dataclasses import dataclass
 from typing import Optional
 
+import orjson
 from openai import AsyncOpenAI
 
 from .config import get_settings
+from .http_client import shared_client_kwargs
 from .models import PersonaSpec
 
+_SYSTEM_PROMPT = (
+    "You are roleplaying as a consumer in a concept test."
+    " Answer concisely in 1-2 sentences. Be realistic and grounded."
+    " Avoid numerical ratings or Likert numbers."
+    " Always respond with valid JSON of the form {\"rationale\": \"...\"}."
+)
+
+# Upper bound on samples requested per Chat Completions call.
+_MAX_CHOICES_PER_REQUEST = 16
+
 
 @dataclass(slots=True)
 class ElicitationResult:
@@ -28,7 +40,9 @@ class ElicitationClient:
             raise RuntimeError("OPENAI_API_KEY is not configured")
 
         base_url = str(settings.openai_base_url) if settings.openai_base_url else None
-        self._client = AsyncOpenAI(api_key=api_key, base_url=base_url)
+        self._client = AsyncOpenAI(
+            api_key=api_key, base_url=base_url, **shared_client_kwargs()
+        )
         self._model = model_override or settings.openai_responses_model
 
     async def generate_rationale(
@@ -37,19 +51,7 @@ class ElicitationClient:
         prompt_block: str,
         question: str,
     ) -> ElicitationResult:
-        persona_description = persona.describe()
-
-        prompt = (
-            "You are roleplaying as a consumer in a concept test."
-            " Answer concisely in 1-2 sentences. Be realistic and grounded."
-            " Avoid numerical ratings or Likert numbers."
-            " Always respond with valid JSON of the form {\"rationale\": \"...\"}."
-            "\n\n"
-            f"Persona: {persona.name} ({persona_description}).\n"
-            f"Stimulus:\n{prompt_block}\n\n"
-            f"Question: {question}\n"
-            "Return only the JSON object."
-        )
+        prompt = _build_prompt(persona, prompt_block, question)
         cache_namespace = f"elicitation:{self._model}"
 
         from .cache import add_to_cache, get_from_cache
@@ -60,6 +62,7 @@ class ElicitationClient:
 
         response = await self._client.responses.create(
             model=self._model,
+            instructions=_SYSTEM_PROMPT,
             input=prompt,
         )
 
@@ -67,21 +70,83 @@ class ElicitationClient:
         if not raw_text:
             raise RuntimeError("Model returned empty rationale")
 
-        raw_text = raw_text.strip()
-
-        rationale = raw_text
-        if raw_text.startswith("{"):
-            import json
-
-            try:
-                parsed = json.loads(raw_text)
-                rationale = parsed.get("rationale") or raw_text
-            except json.JSONDecodeError:
-                rationale = raw_text
-
+        rationale = _parse_rationale(raw_text)
         add_to_cache(prompt, rationale, namespace=cache_namespace)
         return ElicitationResult(rationale=rationale, used_model=response.model)
 
+    async def generate_rationales(
+        self,
+        persona: PersonaSpec,
+        prompt_block: str,
+        question: str,
+        n: int,
+    ) -> list[ElicitationResult]:
+        """Sample up to ``n`` independent rationales for one prompt in a single request.
+
+        Uses Chat Completions' server-side ``n`` so the prompt is sent (and
+        prefilled) once; the model is the same ``RESEARCH_MODEL`` that
+        :meth:`generate_rationale` sends to the Responses API. Some
+        OpenAI-compatible endpoints ignore ``n`` and return fewer choices, so
+        callers should request any shortfall (see :func:`generate_batch`).
+        Samples are deliberately not cached: callers want distinct draws, not
+        the same rationale ``n`` times.
+        """
+        prompt = _build_prompt(persona, prompt_block, question)
+        response = await self._client.chat.completions.create(
+            model=self._model,
+            messages=[
+                {"role": "system", "content": _SYSTEM_PROMPT},
+                {"role": "user", "content": prompt},
+            ],
+            response_format={"type": "json_object"},
+            n=n,
+        )
+        if not response.choices:
+            raise RuntimeError("Model returned no rationales")
+
+        results: list[ElicitationResult] = []
+        for choice in response.choices[:n]:
+            raw_text = choice.message.content
+            if not raw_text:
+                raise RuntimeError("Model returned empty rationale")
+            results.append(
+                ElicitationResult(
+                    rationale=_parse_rationale(raw_text), used_model=response.model
+                )
+            )
+        return results
+
+
+def _build_prompt(persona: PersonaSpec, prompt_block: str, question: str) -> str:
+    """Build the user prompt; the static instructions travel separately.
+
+    Instructions and the persona line lead every request verbatim so provider
+    prompt-prefix caches can reuse them across draws for the same persona.
+    """
+    return (
+        f"Persona: {persona.name} ({persona.describe()}).\n"
+        f"Stimulus:\n{prompt_block}\n\n"
+        f"Question: {question}\n"
+        "Return only the JSON object."
+    )
+
+
+def _parse_rationale(raw_text: str) -> str:
+    """Unwrap ``{"rationale": ...}`` replies, falling back to the raw text."""
+    raw_text = raw_text.strip()
+    if not raw_text.startswith("{"):
+        return raw_text
+    try:
+        parsed = orjson.loads(raw_text)
+    except orjson.JSONDecodeError:
+        return raw_text
+    if not isinstance(parsed, dict):
+        return raw_text
+    rationale = parsed.get("rationale")
+    if not isinstance(rationale, str) or not rationale:
+        return raw_text
+    return rationale
+
 
 async def generate_batch(
     client: ElicitationClient,
@@ -91,35 +156,45 @@ async def generate_batch(
     n: int,
     concurrency: int = 32,
 ) -> list[ElicitationResult]:
-    semaphore = asyncio.Semaphore(concurrency)
-    results: list[ElicitationResult] = []
+    """Collect ``n`` rationales, sampling up to 16 per request via ``n=``.
 
-    async def run_single(idx: int) -> None:
+    Requests go through :meth:`ElicitationClient.generate_rationales`, i.e.
+    Chat Completions rather than the Responses API.
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+    chunk_sizes = [
+        min(_MAX_CHOICES_PER_REQUEST, n - start)
+        for start in range(0, n, _MAX_CHOICES_PER_REQUEST)
+    ]
+
+    async def run_chunk(size: int) -> list[ElicitationResult]:
+        # Samples already received are kept; only the shortfall is requested
+        # again, whether the endpoint ignored ``n`` or a request failed.
+        results: list[ElicitationResult] = []
+        failed: Optional[Exception] = None
         async with semaphore:
-            try:
-                res = await client.generate_rationale(
-                    persona=persona,
-                    prompt_block=prompt_block,
-                    question=question,
-                )
-                results.append(res)
-            except Exception as err:  # noqa: BLE001
-                # One retry in case of transient API issues
+            while len(results) < size:
                 try:
-                    res = await client.generate_rationale(
-                        persona=persona,
-                        prompt_block=prompt_block,
-                        question=question,
+                    results.extend(
+                        await client.generate_rationales(
+                            persona=persona,
+                            prompt_block=prompt_block,
+                            question=question,
+                            n=size - len(results),
+                        )
                     )
-                    results.append(res)
-                except Exception as inner_err:  # noqa: BLE001
-                    raise RuntimeError(
-                        "Failed to elicit rationale for persona "
-                        f"{persona.name}: {inner_err}"
-                    ) from err
-
-    await asyncio.gather(*(run_single(i) for i in range(n)))
-    return results
+                except Exception as err:  # noqa: BLE001
+                    # One retry in case of transient API issues
+                    if failed is not None:
+                        raise RuntimeError(
+                            "Failed to elicit rationale for persona "
+                            f"{persona.name}: {err}"
+                        ) from failed
+                    failed = err
+        return results
+
+    chunks = await asyncio.gather(*(run_chunk(size) for size in chunk_sizes))
+    return [result for chunk in chunks for result in chunk]
 
 
 __all__ = ["ElicitationClient", "ElicitationResult", "generate_batch"]
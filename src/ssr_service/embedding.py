@@ -2,8 +2,11 @@
 
 from __future__ import annotations
 
+import base64
+import threading
+from collections import OrderedDict
 from functools import lru_cache
-from typing import Iterable, List
+from typing import Dict, Iterable, List, Sequence, Tuple
 
 import numpy as np
 from openai import OpenAI
@@ -20,23 +23,65 @@ def _get_client() -> OpenAI:
     return OpenAI(api_key=settings.openai_api_key, base_url=base_url)
 
 
+# (model, text) -> embedding, least recently used first. Anchors and repeated
+# rationales are re-embedded constantly, so hits skip the API entirely.
+_EMBED_CACHE: OrderedDict[Tuple[str, str], np.ndarray] = OrderedDict()
+_EMBED_CACHE_SIZE = 8192
+_EMBED_LOCK = threading.Lock()
+
+
+def _decode_embedding(embedding: str | Sequence[float]) -> np.ndarray:
+    if isinstance(embedding, str):
+        return np.frombuffer(base64.b64decode(embedding), dtype="<f4").astype(
+            np.float32, copy=False
+        )
+    # OpenAI-compatible servers may ignore encoding_format and send floats.
+    return np.asarray(embedding, dtype=np.float32)
+
+
 def embed_texts(texts: Iterable[str]) -> np.ndarray:
-    """Embed a sequence of texts using the configured embedding model."""
+    """Embed a sequence of texts using the configured embedding model.
+
+    Cached texts are served locally; the remaining distinct texts are sent in a
+    single request.
+    """
 
     texts_list: List[str] = list(texts)
     if not texts_list:
         return np.empty((0,))
 
     settings = get_settings()
-    client = _get_client()
-
-    response = client.embeddings.create(
-        model=settings.openai_embedding_model,
-        input=texts_list,
-    )
-
-    vectors = [np.array(item.embedding, dtype=np.float32) for item in response.data]
-    return np.vstack(vectors)
+    model = settings.openai_embedding_model
+
+    found: Dict[str, np.ndarray] = {}
+    with _EMBED_LOCK:
+        for text in texts_list:
+            vector = _EMBED_CACHE.get((model, text))
+            if vector is not None:
+                _EMBED_CACHE.move_to_end((model, text))
+                found[text] = vector
+
+    missing = list(dict.fromkeys(text for text in texts_list if text not in found))
+    if missing:
+        # Raw base64 skips the SDK's float-list decode; vectors come straight
+        # from the response bytes.
+        response = _get_client().embeddings.create(
+            model=model, input=missing, encoding_format="base64"
+        )
+        with _EMBED_LOCK:
+            for text, item in zip(missing, response.data):
+                vector = _decode_embedding(item.embedding)
+                vector.setflags(write=False)
+                found[text] = vector
+                _EMBED_CACHE[(model, text)] = vector
+            while len(_EMBED_CACHE) > _EMBED_CACHE_SIZE:
+                _EMBED_CACHE.popitem(last=False)
+
+    dim = found[texts_list[0]].shape[0]
+    matrix = np.empty((len(texts_list), dim), dtype=np.float32)
+    for row, text in enumerate(texts_list):
+        matrix[row] = found[text]
+    return matrix
 
 
 def embed_text(text: str) -> np.ndarray:
@@ -0,0 +1,94 @@
+"""Shared HTTP connection pool for upstream (LLM and concept URL) calls."""
+
+from __future__ import annotations
+
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from importlib.util import find_spec
+from typing import Any, AsyncGenerator, Dict, Optional
+
+import httpx
+
+from .config import get_settings
+
+_client: Optional[httpx.AsyncClient] = None
+# Per-run client, visible only to the task that opened it and the tasks it
+# spawns, so overlapping runs on one loop never share (or close) each other's.
+_scoped_client: ContextVar[Optional[httpx.AsyncClient]] = ContextVar(
+    "ssr_http_client", default=None
+)
+
+# Callers that draw from the pool at full provider concurrency: the OpenAI and
+# Perplexity providers, plus one share for retrieval, persona generation and
+# audience synthesis.
+_POOL_SHARES = 3
+
+
+def create_http_client(max_concurrency: Optional[int] = None) -> httpx.AsyncClient:
+    """Build the pooled client; HTTP/2 is enabled when the h2 package is present.
+
+    The pool holds ``MAX_CONCURRENCY`` connections per share (see
+    ``_POOL_SHARES``) so it never caps the per-provider concurrency gates in
+    the orchestrator. Without h2 each in-flight request needs its own
+    HTTP/1.1 connection.
+    """
+
+    per_share = max_concurrency or get_settings().max_concurrency
+    max_connections = per_share * _POOL_SHARES
+    return httpx.AsyncClient(
+        http2=find_spec("h2") is not None,
+        limits=httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_connections,
+        ),
+        timeout=60.0,
+    )
+
+
+def set_http_client(client: Optional[httpx.AsyncClient]) -> None:
+    """Register (or clear) the process-wide client, normally from the API lifespan."""
+
+    global _client
+    _client = client
+
+
+def get_http_client() -> Optional[httpx.AsyncClient]:
+    """Return the current run's client, else the process-wide one, else ``None``."""
+
+    return _scoped_client.get() or _client
+
+
+@asynccontextmanager
+async def scoped_http_client() -> AsyncGenerator[httpx.AsyncClient, None]:
+    """Open a pooled client for the current context and close it on exit."""
+
+    async with create_http_client() as client:
+        token = _scoped_client.set(client)
+        try:
+            yield client
+        finally:
+            _scoped_client.reset(token)
+
+
+def shared_client_kwargs() -> Dict[str, Any]:
+    """Return ``{"http_client": ...}`` when a pool is registered, else ``{}``.
+
+    Spread into ``AsyncOpenAI(...)`` so SDK clients fall back to their own
+    default pool instead of receiving ``http_client=None``. Newer openai
+    releases annotate the parameter as ``httpx2.AsyncClient`` but still accept
+    an ``httpx.AsyncClient`` at runtime, hence the untyped mapping.
+    """
+
+    client = get_http_client()
+    if client is None:
+        return {}
+    return {"http_client": client}
+
+
+__all__ = [
+    "create_http_client",
+    "get_http_client",
+    "scoped_http_client",
+    "set_http_client",
+    "shared_client_kwargs",
+]
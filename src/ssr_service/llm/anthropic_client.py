@@ -2,19 +2,26 @@
 
 from __future__ import annotations
 
-from typing import Optional
+from typing import ClassVar, Optional
 
 from anthropic import AsyncAnthropic
 
 from ..cache import add_to_cache, get_from_cache
 from ..config import get_settings
 from ..models import PersonaSpec
-from .base import LLMProvider, LLMResponse
+from .base import (
+    LLMProvider,
+    LLMResponse,
+    build_rationale_prompt,
+    parse_embedded_rationale,
+)
 
 
 class AnthropicProvider(LLMProvider):
     """Anthropic provider implementation."""
 
+    provider_name: ClassVar[str] = "anthropic"
+
     def __init__(self, model_override: Optional[str] = None) -> None:
         settings = get_settings()
         api_key = settings.anthropic_api_key
@@ -22,15 +29,8 @@ class AnthropicProvider(LLMProvider):
             raise RuntimeError("ANTHROPIC_API_KEY is not configured")
 
         self._client = AsyncAnthropic(api_key=api_key)
-        self._model = model_override or settings.anthropic_model
-
-    @property
-    def provider_name(self) -> str:
-        return "anthropic"
-
-    @property
-    def default_model(self) -> str:
-        return self._model
+        self.default_model = model_override or settings.anthropic_model
+        self._keep_raw = settings.keep_raw_responses
 
     async def generate_rationale(
         self,
@@ -40,24 +40,8 @@ class AnthropicProvider(LLMProvider):
         seed: Optional[int] = None,
         temperature: Optional[float] = None,
     ) -> LLMResponse:
-        persona_description = persona.describe()
-
-        prompt = (
-            "You are roleplaying as a consumer in a concept test."
-            " Answer concisely in 1-2 sentences. Be realistic and grounded."
-            " Avoid numerical ratings or Likert numbers."
-            " Always respond with valid JSON of the form {\"rationale\": \"...\"}."
-            "\n\n"
-            f"Persona: {persona.name} ({persona_description}).\n"
-            f"Stimulus:\n{prompt_block}\n\n"
-            f"Question: {question}\n"
-        )
-
-        if seed is not None:
-            prompt += f"Response ID: {seed}\n"
-
-        prompt += "Return only the JSON object."
-        cache_namespace = f"{self.provider_name}:{self._model}"
+        prompt = build_rationale_prompt(persona, prompt_block, question, seed)
+        cache_namespace = f"{self.provider_name}:{self.default_model}"
 
         cached_response = get_from_cache(prompt, namespace=cache_namespace)
         if cached_response:
@@ -68,7 +52,7 @@ class AnthropicProvider(LLMProvider):
             )
 
         response = await self._client.messages.create(
-            model=self._model,
+            model=self.default_model,
             max_tokens=1024,
             messages=[{"role": "user", "content": prompt}],
             temperature=temperature or 1.0,
@@ -78,25 +62,13 @@ class AnthropicProvider(LLMProvider):
         if not raw_text:
             raise RuntimeError("Model returned empty rationale")
 
-        import json
-
-        # Anthropic might include preambles, so we try to find the JSON
-        start = raw_text.find("{")
-        end = raw_text.rfind("}") + 1
-        if start != -1 and end != 0:
-            json_str = raw_text[start:end]
-            try:
-                parsed = json.loads(json_str)
-                rationale = parsed.get("rationale") or raw_text
-            except json.JSONDecodeError:
-                rationale = raw_text
-        else:
-            rationale = raw_text
+        # Anthropic might include preambles around the JSON object.
+        rationale = parse_embedded_rationale(raw_text)
 
         add_to_cache(prompt, rationale, namespace=cache_namespace)
         return LLMResponse(
             rationale=rationale,
             provider=self.provider_name,
-            model=self._model,
-            raw_response=response,
+            model=self.default_model,
+            raw_response=response if self._keep_raw else None,
         )
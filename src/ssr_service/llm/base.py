@@ -3,11 +3,71 @@
 from __future__ import annotations
 
 import abc
+import re
 from dataclasses import dataclass
-from typing import Any, Optional
+from typing import Any, ClassVar, Optional
+
+import orjson
 
 from ..models import PersonaSpec
 
+# Outermost ``{...}`` span, for replies that wrap the JSON in prose.
+_JSON_OBJECT = re.compile(r"\{.*\}", re.DOTALL)
+
+_PROMPT_TEMPLATE = (
+    "You are roleplaying as a consumer in a concept test."
+    " Answer concisely in 1-2 sentences. Be realistic and grounded."
+    " Avoid numerical ratings or Likert numbers."
+    " Always respond with valid JSON of the form {{\"rationale\": \"...\"}}."
+    "\n\n"
+    "Persona: {name} ({description}).\n"
+    "Stimulus:\n{prompt_block}\n\n"
+    "Question: {question}\n"
+)
+_PROMPT_TAIL = "Return only the JSON object."
+
+
+def build_rationale_prompt(
+    persona: PersonaSpec,
+    prompt_block: str,
+    question: str,
+    seed: Optional[int] = None,
+) -> str:
+    """Render the single-turn roleplay prompt shared by every provider."""
+    return "".join(
+        (
+            _PROMPT_TEMPLATE.format(
+                name=persona.name,
+                description=persona.describe(),
+                prompt_block=prompt_block,
+                question=question,
+            ),
+            f"Response ID: {seed}\n" if seed is not None else "",
+            _PROMPT_TAIL,
+        )
+    )
+
+
+def parse_embedded_rationale(raw_text: str) -> str:
+    """Return the ``rationale`` from a JSON reply that may carry a preamble.
+
+    Well-formed replies are decoded directly; only when that fails is the
+    outermost brace span extracted and retried. Falls back to the raw text.
+    """
+    try:
+        parsed = orjson.loads(raw_text)
+    except orjson.JSONDecodeError:
+        match = _JSON_OBJECT.search(raw_text)
+        if match is None:
+            return raw_text
+        try:
+            parsed = orjson.loads(match.group(0))
+        except orjson.JSONDecodeError:
+            return raw_text
+    if not isinstance(parsed, dict):
+        return raw_text
+    return parsed.get("rationale") or raw_text
+
 
 @dataclass(slots=True)
 class LLMResponse:
@@ -20,7 +80,14 @@ class LLMResponse:
 
 
 class LLMProvider(abc.ABC):
-    """Abstract base class for LLM providers."""
+    """Abstract base class for LLM providers.
+
+    Subclasses set ``provider_name`` on the class and ``default_model`` in
+    ``__init__``; both are plain attributes read on every rationale call.
+    """
+
+    provider_name: ClassVar[str]
+    default_model: str
 
     @abc.abstractmethod
     async def generate_rationale(
@@ -33,15 +100,3 @@ class LLMProvider(abc.ABC):
     ) -> LLMResponse:
         """Generate a rationale for a given persona and concept."""
         pass
-
-    @property
-    @abc.abstractmethod
-    def provider_name(self) -> str:
-        """Return the name of the provider."""
-        pass
-
-    @property
-    @abc.abstractmethod
-    def default_model(self) -> str:
-        """Return the default model for this provider."""
-        pass
@@ -2,25 +2,29 @@
 
 from __future__ import annotations
 
-from typing import Optional
+from importlib import import_module
+from typing import Dict, Optional, Tuple
 
-from .anthropic_client import AnthropicProvider
 from .base import LLMProvider
-from .gemini_client import GeminiProvider
-from .openai_client import OpenAIProvider
-from .perplexity_client import PerplexityProvider
+
+# Provider name (and aliases) -> (module, class). Modules are imported on first
+# use: the Anthropic and Gemini SDKs take over a second to import, which every
+# CLI run and test session would otherwise pay even when only OpenAI is used.
+_PROVIDERS: Dict[str, Tuple[str, str]] = {
+    "openai": (".openai_client", "OpenAIProvider"),
+    "anthropic": (".anthropic_client", "AnthropicProvider"),
+    "claude": (".anthropic_client", "AnthropicProvider"),
+    "gemini": (".gemini_client", "GeminiProvider"),
+    "google": (".gemini_client", "GeminiProvider"),
+    "perplexity": (".perplexity_client", "PerplexityProvider"),
+}
 
 
 def get_provider(name: str, model_override: Optional[str] = None) -> LLMProvider:
     """Get an LLM provider by name."""
-    name = name.lower()
-    if name == "openai":
-        return OpenAIProvider(model_override)
-    elif name == "anthropic" or name == "claude":
-        return AnthropicProvider(model_override)
-    elif name == "gemini" or name == "google":
-        return GeminiProvider(model_override)
-    elif name == "perplexity":
-        return PerplexityProvider(model_override)
-    else:
-        raise ValueError(f"Unknown provider: {name}")
+    try:
+        module_name, class_name = _PROVIDERS[name.lower()]
+    except KeyError:
+        raise ValueError(f"Unknown provider: {name}") from None
+    provider_cls = getattr(import_module(module_name, __package__), class_name)
+    return provider_cls(model_override)
@@ -2,20 +2,40 @@
 
 from __future__ import annotations
 
-from typing import Optional
+from functools import lru_cache
+from typing import ClassVar, Optional
 
 import google.generativeai as genai
+import orjson
 from google.generativeai.types import GenerationConfig, HarmBlockThreshold, HarmCategory
+from google.generativeai.types.safety_types import SafetySettingOptions
 
 from ..cache import add_to_cache, get_from_cache
 from ..config import get_settings
 from ..models import PersonaSpec
-from .base import LLMProvider, LLMResponse
+from .base import LLMProvider, LLMResponse, build_rationale_prompt
+
+_SAFETY_SETTINGS: SafetySettingOptions = {
+    HarmCategory.HARM_CATEGORY_HARASSMENT: HarmBlockThreshold.BLOCK_NONE,
+    HarmCategory.HARM_CATEGORY_HATE_SPEECH: HarmBlockThreshold.BLOCK_NONE,
+    HarmCategory.HARM_CATEGORY_SEXUALLY_EXPLICIT: HarmBlockThreshold.BLOCK_NONE,
+    HarmCategory.HARM_CATEGORY_DANGEROUS_CONTENT: HarmBlockThreshold.BLOCK_NONE,
+}
+
+
+@lru_cache(maxsize=8)
+def _generation_config(temperature: Optional[float]) -> GenerationConfig:
+    return GenerationConfig(
+        response_mime_type="application/json",
+        temperature=temperature,
+    )
 
 
 class GeminiProvider(LLMProvider):
     """Gemini provider implementation."""
 
+    provider_name: ClassVar[str] = "gemini"
+
     def __init__(self, model_override: Optional[str] = None) -> None:
         settings = get_settings()
         api_key = settings.google_api_key
@@ -23,16 +43,9 @@ class GeminiProvider(LLMProvider):
             raise RuntimeError("GOOGLE_API_KEY is not configured")
 
         genai.configure(api_key=api_key)
-        self._model_name = model_override or settings.gemini_model
-        self._model = genai.GenerativeModel(self._model_name)
-
-    @property
-    def provider_name(self) -> str:
-        return "gemini"
-
-    @property
-    def default_model(self) -> str:
-        return self._model_name
+        self.default_model = model_override or settings.gemini_model
+        self._model = genai.GenerativeModel(self.default_model)
+        self._keep_raw = settings.keep_raw_responses
 
     async def generate_rationale(
         self,
@@ -42,24 +55,8 @@ class GeminiProvider(LLMProvider):
         seed: Optional[int] = None,
         temperature: Optional[float] = None,
     ) -> LLMResponse:
-        persona_description = persona.describe()
-
-        prompt = (
-            "You are roleplaying as a consumer in a concept test."
-            " Answer concisely in 1-2 sentences. Be realistic and grounded."
-            " Avoid numerical ratings or Likert numbers."
-            " Always respond with valid JSON of the form {\"rationale\": \"...\"}."
-            "\n\n"
-            f"Persona: {persona.name} ({persona_description}).\n"
-            f"Stimulus:\n{prompt_block}\n\n"
-            f"Question: {question}\n"
-        )
-
-        if seed is not None:
-            prompt += f"Response ID: {seed}\n"
-
-        prompt += "Return only the JSON object."
-        cache_namespace = f"{self.provider_name}:{self._model_name}"
+        prompt = build_rationale_prompt(persona, prompt_block, question, seed)
+        cache_namespace = f"{self.provider_name}:{self.default_model}"
 
         cached_response = get_from_cache(prompt, namespace=cache_namespace)
         if cached_response:
@@ -76,34 +73,24 @@ class GeminiProvider(LLMProvider):
         
         response = await self._model.generate_content_async(
             contents=prompt,
-            generation_config=GenerationConfig(
-                response_mime_type="application/json",
-                temperature=temperature,
-            ),
-            safety_settings={
-                HarmCategory.HARM_CATEGORY_HARASSMENT: HarmBlockThreshold.BLOCK_NONE,
-                HarmCategory.HARM_CATEGORY_HATE_SPEECH: HarmBlockThreshold.BLOCK_NONE,
-                HarmCategory.HARM_CATEGORY_SEXUALLY_EXPLICIT: HarmBlockThreshold.BLOCK_NONE,
-                HarmCategory.HARM_CATEGORY_DANGEROUS_CONTENT: HarmBlockThreshold.BLOCK_NONE,
-            }
+            generation_config=_generation_config(temperature),
+            safety_settings=_SAFETY_SETTINGS,
         )
 
         raw_text = response.text
         if not raw_text:
             raise RuntimeError("Model returned empty rationale")
 
-        import json
-
         try:
-            parsed = json.loads(raw_text)
+            parsed = orjson.loads(raw_text)
             rationale = parsed.get("rationale") or raw_text
-        except json.JSONDecodeError:
+        except orjson.JSONDecodeError:
             rationale = raw_text
 
         add_to_cache(prompt, rationale, namespace=cache_namespace)
         return LLMResponse(
             rationale=rationale,
             provider=self.provider_name,
-            model=self._model_name,
-            raw_response=response,
+            model=self.default_model,
+            raw_response=response if self._keep_raw else None,
         )
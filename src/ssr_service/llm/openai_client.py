@@ -2,36 +2,39 @@
 
 from __future__ import annotations
 
-from typing import Optional
+from typing import Any, ClassVar, Dict, Optional
 
+import orjson
 from openai import AsyncOpenAI
 
 from ..cache import add_to_cache, get_from_cache
 from ..config import get_settings
+from ..http_client import shared_client_kwargs
 from ..models import PersonaSpec
-from .base import LLMProvider, LLMResponse
+from .base import LLMProvider, LLMResponse, build_rationale_prompt
 
 
-class OpenAIProvider(LLMProvider):
-    """OpenAI provider implementation."""
+class OpenAICompatibleProvider(LLMProvider):
+    """Chat-completions flow shared by providers that speak the OpenAI API.
 
-    def __init__(self, model_override: Optional[str] = None) -> None:
-        settings = get_settings()
-        api_key = settings.openai_api_key
-        if not api_key:
-            raise RuntimeError("OPENAI_API_KEY is not configured")
+    Subclasses build the client and pick the model; they may override
+    ``_completion_kwargs`` and ``_parse_rationale`` for endpoint quirks.
+    """
 
-        base_url = str(settings.openai_base_url) if settings.openai_base_url else None
-        self._client = AsyncOpenAI(api_key=api_key, base_url=base_url)
-        self._model = model_override or settings.openai_responses_model
+    def __init__(self, client: AsyncOpenAI, model: str, *, keep_raw: bool) -> None:
+        self._client = client
+        self.default_model = model
+        self._keep_raw = keep_raw
 
-    @property
-    def provider_name(self) -> str:
-        return "openai"
+    def _completion_kwargs(self, temperature: Optional[float]) -> Dict[str, Any]:
+        return {"response_format": {"type": "json_object"}, "temperature": temperature}
 
-    @property
-    def default_model(self) -> str:
-        return self._model
+    def _parse_rationale(self, raw_text: str) -> str:
+        try:
+            parsed = orjson.loads(raw_text)
+            return parsed.get("rationale") or raw_text
+        except orjson.JSONDecodeError:
+            return raw_text
 
     async def generate_rationale(
         self,
@@ -41,24 +44,8 @@ class OpenAIProvider(LLMProvider):
         seed: Optional[int] = None,
         temperature: Optional[float] = None,
     ) -> LLMResponse:
-        persona_description = persona.describe()
-
-        prompt = (
-            "You are roleplaying as a consumer in a concept test."
-            " Answer concisely in 1-2 sentences. Be realistic and grounded."
-            " Avoid numerical ratings or Likert numbers."
-            " Always respond with valid JSON of the form {\"rationale\": \"...\"}."
-            "\n\n"
-            f"Persona: {persona.name} ({persona_description}).\n"
-            f"Stimulus:\n{prompt_block}\n\n"
-            f"Question: {question}\n"
-        )
-
-        if seed is not None:
-            prompt += f"Response ID: {seed}\n"
-
-        prompt += "Return only the JSON object."
-        cache_namespace = f"{self.provider_name}:{self._model}"
+        prompt = build_rationale_prompt(persona, prompt_block, question, seed)
+        cache_namespace = f"{self.provider_name}:{self.default_model}"
 
         cached_response = get_from_cache(prompt, namespace=cache_namespace)
         if cached_response:
@@ -69,28 +56,42 @@ class OpenAIProvider(LLMProvider):
             )
 
         response = await self._client.chat.completions.create(
-            model=self._model,
+            model=self.default_model,
             messages=[{"role": "user", "content": prompt}],
-            response_format={"type": "json_object"},
-            temperature=temperature,
+            **self._completion_kwargs(temperature),
         )
 
         raw_text = response.choices[0].message.content
         if not raw_text:
             raise RuntimeError("Model returned empty rationale")
 
-        import json
-
-        try:
-            parsed = json.loads(raw_text)
-            rationale = parsed.get("rationale") or raw_text
-        except json.JSONDecodeError:
-            rationale = raw_text
+        rationale = self._parse_rationale(raw_text)
 
         add_to_cache(prompt, rationale, namespace=cache_namespace)
         return LLMResponse(
             rationale=rationale,
             provider=self.provider_name,
-            model=self._model,
-            raw_response=response,
+            model=self.default_model,
+            raw_response=response if self._keep_raw else None,
+        )
+
+
+class OpenAIProvider(OpenAICompatibleProvider):
+    """OpenAI provider implementation."""
+
+    provider_name: ClassVar[str] = "openai"
+
+    def __init__(self, model_override: Optional[str] = None) -> None:
+        settings = get_settings()
+        api_key = settings.openai_api_key
+        if not api_key:
+            raise RuntimeError("OPENAI_API_KEY is not configured")
+
+        base_url = str(settings.openai_base_url) if settings.openai_base_url else None
+        super().__init__(
+            AsyncOpenAI(
+                api_key=api_key, base_url=base_url, **shared_client_kwargs()
+            ),
+            model_override or settings.openai_responses_model,
+            keep_raw=settings.keep_raw_responses,
         )
@@ -149,28 +149,29 @@ class PersonaTemplate(BaseModel):
     def to_persona_spec(self, fallback_name: str) -> PersonaSpec:
         """Convert the template into a PersonaSpec, applying defaults as needed."""
 
-        persona_data: Dict[str, Union[str, List[str], float, None]] = {
-            "name": self.name or fallback_name,
-            "age": self.age,
-            "gender": self.gender,
-            "income": self.income,
-            "region": self.region,
-            "occupation": self.occupation,
-            "education": self.education,
-            "household": self.household,
-            "purchase_frequency": self.purchase_frequency,
-            "usage_context": self.usage_context,
-            "background": self.background,
-            "habits": self.habits,
-            "motivations": self.motivations,
-            "pain_points": self.pain_points,
-            "preferred_channels": self.preferred_channels,
-            "descriptors": self.descriptors,
-            "notes": self.notes,
-            "source": self.source,
-            "weight": self.weight or 1.0,
-        }
-        return PersonaSpec.model_validate(persona_data)
+        # Fields were validated on the template, so skip re-validation; lists are
+        # copied so the spec never aliases the template's.
+        return PersonaSpec.model_construct(
+            name=self.name or fallback_name,
+            age=self.age,
+            gender=self.gender,
+            income=self.income,
+            region=self.region,
+            occupation=self.occupation,
+            education=self.education,
+            household=self.household,
+            purchase_frequency=self.purchase_frequency,
+            usage_context=self.usage_context,
+            background=self.background,
+            habits=list(self.habits),
+            motivations=list(self.motivations),
+            pain_points=list(self.pain_points),
+            preferred_channels=list(self.preferred_channels),
+            descriptors=list(self.descriptors),
+            notes=self.notes,
+            source=self.source,
+            weight=self.weight or 1.0,
+        )
 
 
 class PersonaGenerationTask(BaseModel):
@@ -267,6 +268,15 @@ class SimulationOptions(BaseModel):
         default=False,
         description="Include respondent-level records for cross-question analysis.",
     )
+    concurrency: Optional[int] = Field(
+        default=None,
+        ge=1,
+        le=512,
+        description=(
+            "Max in-flight LLM calls per provider across the whole simulation "
+            "(defaults to MAX_CONCURRENCY capped at 64; never exceeds MAX_CONCURRENCY)."
+        ),
+    )
 
 
 class QuestionSpec(BaseModel):
@@ -431,7 +441,14 @@ class PersonaGroupSummary(BaseModel):
     source: Optional[str] = None
 
 
+class AudienceBuildResponse(BaseModel):
+    population_spec: PopulationSpec
+    reasoning: str
+    evidence_summary_length: int
+
+
 __all__ = [
+    "AudienceBuildResponse",
     "ConceptInput",
     "LikertDistribution",
     "PanelAllocation",
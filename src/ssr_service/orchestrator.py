@@ -253,8 +253,15 @@ async def generate_batch(
     seed_offset: int = 0,
     concurrency: int = 32,
     temperature: Optional[float] = None,
+    semaphore: Optional[asyncio.Semaphore] = None,
 ) -> List[LLMResponse]:
-    semaphore = asyncio.Semaphore(concurrency)
+    """Elicit ``n`` rationales concurrently, in seed order.
+
+    Pass a shared ``semaphore`` to cap in-flight calls across several batches
+    (``concurrency`` is ignored then); otherwise the batch gets its own.
+    """
+    if semaphore is None:
+        semaphore = asyncio.Semaphore(concurrency)
     results: List[Optional[LLMResponse]] = [None] * n
 
     async def run_single(idx: int) -> None:
@@ -292,21 +299,36 @@ async def generate_batch(
     return ordered
 
 
+def _provider_concurrency(options: SimulationOptions, settings: AppSettings) -> int:
+    """Per-provider in-flight limit; a request may lower MAX_CONCURRENCY, never raise it."""
+
+    if options.concurrency:
+        return min(options.concurrency, settings.max_concurrency)
+    return min(settings.max_concurrency, 64)
+
+
+def _build_prompt_block(artifact: ConceptArtifact, options: SimulationOptions) -> str:
+    prompt_block = artifact.as_prompt_block()
+    if options.additional_instructions:
+        prompt_block += f"\n\nAdditional Instructions:\n{options.additional_instructions}"
+    return prompt_block
+
+
 async def _simulate_persona(
     persona: PersonaSpec,
-    artifact: ConceptArtifact,
+    prompt_block: str,
     question: str,
     question_id: str,
     intent: str,
     anchor_bank: str,
     rater: SemanticSimilarityRater,
     providers: List[LLMProvider],
+    provider_gates: List[asyncio.Semaphore],
     draws: int,
     seed_base: int,
     options: SimulationOptions,
 ) -> Tuple[PersonaQuestionResult, np.ndarray, List[LLMResponse]]:
-    settings = get_settings()
-    
+
     # Distribute draws across providers
     # Simple strategy: split evenly, or just use the first one if only one
     # If multiple providers, we might want to run 'draws' for EACH provider, or split 'draws' among them.
@@ -321,13 +343,9 @@ async def _simulate_persona(
     
     all_results: List[LLMResponse] = []
     
-    prompt_block = artifact.as_prompt_block()
-    if options.additional_instructions:
-        prompt_block += f"\n\nAdditional Instructions:\n{options.additional_instructions}"
-
     tasks = []
     seed_offset = seed_base
-    for i, provider in enumerate(providers):
+    for i, (provider, gate) in enumerate(zip(providers, provider_gates)):
         count = draws_per_provider + (1 if i < remainder else 0)
         if count > 0:
             tasks.append(
@@ -338,8 +356,8 @@ async def _simulate_persona(
                     question=question,
                     n=count,
                     seed_offset=seed_offset,
-                    concurrency=min(settings.max_concurrency, 64),
                     temperature=options.temperature,
+                    semaphore=gate,
                 )
             )
             seed_offset += count
@@ -668,8 +686,14 @@ async def run_simulation(request: SimulationRequest) -> SimulationResponse:
     # Initialize providers
     provider_names = options.providers or ["openai"]
     providers = [get_provider(name, model_override=options.model) for name in provider_names]
+    # One gate per provider, shared by every persona and question, so the
+    # total in-flight calls to each API stay bounded however large the panel.
+    concurrency = _provider_concurrency(options, settings)
+    provider_gates = [asyncio.Semaphore(concurrency) for _ in providers]
 
     artifact = await ingest_concept(concept_input)
+    # Built once and shared by reference across every persona and question.
+    prompt_block = _build_prompt_block(artifact, options)
     question_specs = _build_question_specs(
         request, options, locale=locale, settings=settings
     )
@@ -720,13 +744,14 @@ async def run_simulation(request: SimulationRequest) -> SimulationResponse:
         persona_tasks = [
             _simulate_persona(
                 persona,
-                artifact,
+                prompt_block,
                 qtext,
                 qid,
                 intent,
                 anchor_bank,
                 rater,
                 providers,
+                provider_gates,
                 draws,
                 options.seed + persona_idx * 1_000_000,
                 options,
@@ -10,6 +10,7 @@ from typing import Iterable, List, Mapping
 from openai import AsyncOpenAI
 
 from .config import AppSettings
+from .http_client import shared_client_kwargs
 from .models import PersonaGenerationTask, PersonaSpec
 
 _THAI_CHAR_RE = re.compile(r"[\u0E00-\u0E7F]")
@@ -251,7 +252,9 @@ def _openai_config(settings: AppSettings) -> OpenAIConfig:
     if not api_key:
         raise RuntimeError("OPENAI_API_KEY is not configured for persona generation")
     base_url = str(settings.openai_base_url) if settings.openai_base_url else None
-    client = AsyncOpenAI(api_key=api_key, base_url=base_url)
+    client = AsyncOpenAI(
+        api_key=api_key, base_url=base_url, **shared_client_kwargs()
+    )
     return OpenAIConfig(client=client, model=settings.openai_responses_model)
 
 
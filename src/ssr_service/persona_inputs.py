@@ -3,9 +3,11 @@
 from __future__ import annotations
 
 import json
+import re
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, Iterator, List, Tuple
 
+import orjson
 import yaml
 
 from .models import (
@@ -17,6 +19,15 @@ from .models import (
     QuestionSpec,
 )
 
+# One ``key=value`` pair per ``;``-separated token; tokens without ``=`` are skipped.
+_PAIR_RE = re.compile(r"(?:^|;)\s*([^;=]*?)\s*=([^;]*)")
+
+
+def _iter_pairs(expr: str) -> Iterator[Tuple[str, str]]:
+    """Yield stripped ``(key, value)`` pairs from a ``k=v;k=v`` expression."""
+    for match in _PAIR_RE.finditer(expr):
+        yield match.group(1), match.group(2).strip()
+
 
 def _split_csv(value: str) -> List[str]:
     return [item.strip() for item in value.split(",") if item.strip()]
@@ -33,12 +44,7 @@ def parse_filter_expression(expr: str) -> PersonaFilter:
     limit: int | None = None
     weight_share: float | None = None
 
-    for token in (part.strip() for part in expr.split(";") if part.strip()):
-        if "=" not in token:
-            continue
-        key, raw_value = token.split("=", 1)
-        key = key.strip()
-        raw_value = raw_value.strip()
+    for key, raw_value in _iter_pairs(expr):
 
         if key == "group":
             group = raw_value or None
@@ -79,12 +85,7 @@ def parse_generation_expression(expr: str) -> PersonaGenerationTask:
     weight_share: float | None = None
     attributes: Dict[str, str] = {}
 
-    for token in (part.strip() for part in expr.split(";") if part.strip()):
-        if "=" not in token:
-            continue
-        key, raw_value = token.split("=", 1)
-        key = key.strip()
-        raw_value = raw_value.strip()
+    for key, raw_value in _iter_pairs(expr):
 
         if key == "prompt":
             prompt = raw_value
@@ -119,19 +120,14 @@ def parse_injection_payload(expr: str) -> PersonaInjection:
     potential_path = Path(expr)
     data: Dict[str, Any]
     if potential_path.exists():
-        data = json.loads(potential_path.read_text(encoding="utf-8"))
+        data = orjson.loads(potential_path.read_bytes())
     else:
         try:
             data = json.loads(expr)
         except json.JSONDecodeError:
             data = {}
             weight_share: float | None = None
-            for token in (part.strip() for part in expr.split(";") if part.strip()):
-                if "=" not in token:
-                    continue
-                key, raw_value = token.split("=", 1)
-                key = key.strip()
-                raw_value = raw_value.strip()
+            for key, raw_value in _iter_pairs(expr):
                 if key in {"share", "weight_share"}:
                     weight_share = float(raw_value)
                     data["weight_share"] = weight_share
@@ -151,6 +147,15 @@ def parse_injection_payload(expr: str) -> PersonaInjection:
                 else:
                     persona_payload[key] = raw_value
 
+    return parse_injection_payload_dict(data)
+
+
+def parse_injection_payload_dict(data: Dict[str, Any]) -> PersonaInjection:
+    """Build an injection from an already-decoded payload.
+
+    Accepts either ``{"persona": {...}, "weight_share": ...}`` or a bare persona
+    mapping, so callers holding parsed JSON need not re-serialize each entry.
+    """
     persona_payload = data.get("persona", data)
     weight_share = data.get("weight_share")
     persona = PersonaSpec.model_validate(persona_payload)
@@ -165,11 +170,9 @@ def parse_population_spec_input(expr: str) -> PopulationSpec:
     if not candidate:
         raise ValueError("population spec input cannot be empty")
 
+    # YAML and JSON both decode raw bytes, so files are never copied into a str.
     path = Path(candidate)
-    if path.exists():
-        text = path.read_text(encoding="utf-8")
-    else:
-        text = expr
+    text: str | bytes = path.read_bytes() if path.exists() else expr
 
     try:
         data = yaml.safe_load(text)
@@ -191,12 +194,7 @@ def parse_question_spec_expression(expr: str) -> QuestionSpec:
     intent: str | None = None
     anchor_bank: str | None = None
 
-    for token in (part.strip() for part in expr.split(";") if part.strip()):
-        if "=" not in token:
-            continue
-        key, raw_value = token.split("=", 1)
-        key = key.strip()
-        raw_value = raw_value.strip()
+    for key, raw_value in _iter_pairs(expr):
 
         if key in {"id", "qid", "question_id"}:
             question_id = raw_value or None
@@ -222,6 +220,7 @@ __all__ = [
     "parse_filter_expression",
     "parse_generation_expression",
     "parse_injection_payload",
+    "parse_injection_payload_dict",
     "parse_population_spec_input",
     "parse_question_spec_expression",
 ]
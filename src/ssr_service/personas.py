@@ -7,12 +7,16 @@ from dataclasses import dataclass
 from functools import lru_cache
 from io import StringIO
 from pathlib import Path
-from typing import Dict, Iterable, List, Optional, TextIO, Tuple, Union
+from typing import Any, Dict, Iterable, List, Optional, TextIO, Tuple, Union
 
-import yaml
+from pydantic import TypeAdapter
 
+from .documents import read_document
 from .models import PersonaFilter, PersonaSpec
 
+# Validates a whole group or CSV in one call instead of one model_validate per row.
+_PERSONA_LIST_ADAPTER = TypeAdapter(List[PersonaSpec])
+
 
 @dataclass(slots=True)
 class PersonaGroup:
@@ -41,8 +45,7 @@ def _coerce_str(value: object) -> Optional[str]:
 
 
 def load_persona_group(path: Path) -> PersonaGroup:
-    with path.open("r", encoding="utf-8") as fp:
-        raw = yaml.safe_load(fp)
+    raw = read_document(path)
 
     group_name = str(raw.get("group", path.stem))
     description = str(raw.get("description", ""))
@@ -58,7 +61,7 @@ def load_persona_group(path: Path) -> PersonaGroup:
             return [str(item) for item in value if str(item).strip()]
         return []
 
-    personas: List[PersonaSpec] = []
+    persona_rows: List[Dict[str, Any]] = []
     for entry in personas_data:
             persona_data = {
                 "name": _coerce_str(entry.get("name")) or "Persona",
@@ -86,10 +89,11 @@ def load_persona_group(path: Path) -> PersonaGroup:
                 "context": _list_field(entry, "context"),
                 "weight": _coerce_float(entry.get("weight", 1.0)) or 1.0,
             }
-            personas.append(PersonaSpec.model_validate(persona_data))
+            persona_rows.append(persona_data)
 
-    if not personas:
+    if not persona_rows:
         raise ValueError(f"Persona file {path} contains no personas")
+    personas = _PERSONA_LIST_ADAPTER.validate_python(persona_rows)
 
     source = raw.get("source")
     return PersonaGroup(
@@ -147,18 +151,34 @@ class PersonaLibrary:
         return personas
 
 
-@lru_cache(maxsize=8)
-def get_persona_library(directory: str) -> PersonaLibrary:
-    """Return a cached PersonaLibrary for the provided directory path."""
+LibraryStamp = Tuple[Tuple[str, int], ...]
+
+
+def library_stamp(directory: Union[str, Path]) -> LibraryStamp:
+    """Return (file name, mtime) pairs identifying the current library contents."""
+
+    return tuple(
+        sorted((file.name, file.stat().st_mtime_ns) for file in Path(directory).glob("*.yml"))
+    )
 
+
+@lru_cache(maxsize=4)
+def _load_persona_library(directory: str, stamp: LibraryStamp) -> PersonaLibrary:
+    _ = stamp  # part of the cache key only
     return PersonaLibrary(Path(directory))
 
 
+def get_persona_library(directory: str) -> PersonaLibrary:
+    """Return a cached PersonaLibrary, reloading when its YAML files change."""
+
+    return _load_persona_library(directory, library_stamp(directory))
+
+
 def refresh_persona_library(directory: str) -> None:
     """Clear the cached PersonaLibrary for hot-reload scenarios."""
 
     _ = directory  # retained for API symmetry
-    get_persona_library.cache_clear()
+    _load_persona_library.cache_clear()
 
 
 def get_persona_group(name: str, directory: Path) -> PersonaGroup:
@@ -250,7 +270,7 @@ def filter_personas(
 def personas_from_csv(
     csv_source: Union[Path, str], encoding: str = "utf-8"
 ) -> List[PersonaSpec]:
-    personas: List[PersonaSpec] = []
+    persona_rows: List[Dict[str, Any]] = []
     fh: TextIO
     if isinstance(csv_source, Path):
         fh = csv_source.open("r", encoding=encoding, newline="")
@@ -267,7 +287,7 @@ def personas_from_csv(
 
         for row in reader:
             persona_data = {
-                "name": row.get("name") or f"Persona {len(personas) + 1}",
+                "name": row.get("name") or f"Persona {len(persona_rows) + 1}",
                 "age": row.get("age") or None,
                 "gender": row.get("gender") or None,
                 "income": row.get("income") or None,
@@ -290,12 +310,12 @@ def personas_from_csv(
                 "context": _split_list(row.get("context")),
                 "weight": _coerce_float(row.get("weight")) or 1.0,
             }
-            personas.append(PersonaSpec.model_validate(persona_data))
+            persona_rows.append(persona_data)
 
-    if not personas:
+    if not persona_rows:
         raise ValueError("CSV did not yield any personas")
 
-    return personas
+    return _PERSONA_LIST_ADAPTER.validate_python(persona_rows)
 
 
 def ensure_weights(
@@ -389,6 +409,7 @@ def combine_persona_buckets(buckets: Iterable[PersonaBucket]) -> List[PersonaSpe
 
 
 __all__ = [
+    "LibraryStamp",
     "PersonaBucket",
     "PersonaGroup",
     "PersonaLibrary",
@@ -397,6 +418,7 @@ __all__ = [
     "filter_personas",
     "get_persona_group",
     "get_persona_library",
+    "library_stamp",
     "load_library",
     "load_persona_group",
     "personas_from_csv",
@@ -2,9 +2,10 @@
 
 from __future__ import annotations
 
-from collections import defaultdict
 from pathlib import Path
-from typing import Dict, Iterable, List
+from typing import Dict, Iterable, List, Tuple
+
+import numpy as np
 
 from .config import AppSettings
 from .models import PersonaSpec, PopulationSpec, RakingConfig
@@ -59,6 +60,27 @@ def _category_value(persona: PersonaSpec, field: str) -> str | None:
     return text if text else None
 
 
+def _normalised(weights: np.ndarray) -> np.ndarray:
+    clipped = np.maximum(weights, 0.0)
+    return clipped / (clipped.sum() or 1.0)
+
+
+def _category_codes(
+    personas: List[PersonaSpec], field: str
+) -> Tuple[List[str], np.ndarray]:
+    """Return the distinct categories for a field and each persona's index into them.
+
+    Personas without a usable value for the field are coded as -1.
+    """
+
+    index: Dict[str, int] = {}
+    codes = np.empty(len(personas), dtype=np.intp)
+    for position, persona in enumerate(personas):
+        category = _category_value(persona, field)
+        codes[position] = -1 if category is None else index.setdefault(category, len(index))
+    return list(index), codes
+
+
 def rake_personas(
     personas: Iterable[PersonaSpec],
     marginals: Dict[str, Dict[str, float]],
@@ -67,78 +89,84 @@ def rake_personas(
     """Adjust persona weights to match target marginals using iterative proportional fitting."""
 
     personas_list = [p.model_copy(deep=True) for p in personas]
-    if not marginals or not config.enabled:
-        total = sum(max(p.weight, 0.0) for p in personas_list) or 1.0
-        for p in personas_list:
-            p.weight = max(p.weight, 0.0) / total
-        return personas_list
-
     # Normalize starting weights
-    total = sum(max(p.weight, 0.0) for p in personas_list) or 1.0
-    for p in personas_list:
-        p.weight = max(p.weight, 0.0) / total
-
-    targets = {
-        field: {category: float(weight) for category, weight in buckets.items()}
-        for field, buckets in marginals.items()
-    }
-
-    for _ in range(config.iterations):
-        for field, buckets in targets.items():
-            current_totals: Dict[str, float] = defaultdict(float)
-            field_total = 0.0
-            for persona in personas_list:
-                category = _category_value(persona, field)
-                if category is None:
-                    continue
-                current_totals[category] += persona.weight
-                field_total += persona.weight
-
-            if field_total <= 0:
-                continue
-
-            present_cats = {cat for cat, weight in current_totals.items() if weight > 0}
-            if not present_cats:
-                continue
-
-            missing_required = [
-                cat for cat, weight in buckets.items() if weight > 0 and cat not in present_cats
+    weights = _normalised(np.array([p.weight for p in personas_list], dtype=float))
+
+    if marginals and config.enabled:
+        targets = {
+            field: {category: float(weight) for category, weight in buckets.items()}
+            for field, buckets in marginals.items()
+        }
+        coded_fields = [_category_codes(personas_list, field) for field in targets]
+
+        # Personas that share a category in every raked field always receive the
+        # same adjustment factors, so fit the factors on the collapsed cells and
+        # only expand back to individual persona weights once at the end.
+        persona_codes = np.column_stack([codes for _, codes in coded_fields])
+        cells, cell_index = np.unique(persona_codes, axis=0, return_inverse=True)
+        cell_index = cell_index.reshape(-1)
+        base_cell_weights = np.bincount(
+            cell_index, weights=weights, minlength=len(cells)
+        ).astype(float)
+        cell_weights = base_cell_weights.copy()
+
+        # Everything that depends only on the marginals and the cell layout is
+        # resolved once, leaving integer indexing and bincount in the IPF loop.
+        dimensions = []
+        for column, (field, buckets) in enumerate(targets.items()):
+            categories = coded_fields[column][0]
+            positions = {cat: idx for idx, cat in enumerate(categories)}
+            codes = cells[:, column]
+            coded = codes >= 0
+            target = np.array([buckets.get(cat, 0.0) for cat in categories])
+            required = [
+                (cat, positions.get(cat))
+                for cat, weight in buckets.items()
+                if weight > 0
             ]
-            if missing_required and config.mode == "strict":
-                raise ValueError(
-                    f"Raking failed: field '{field}' missing categories {missing_required}"
+            dimensions.append(
+                (field, len(categories), coded, codes[coded], target, required)
+            )
+
+        for _ in range(config.iterations):
+            for field, size, coded, codes, target, required in dimensions:
+                current_totals = np.bincount(
+                    codes, weights=cell_weights[coded], minlength=size
                 )
-
-            target_sum = sum(buckets.get(cat, 0.0) for cat in present_cats)
-            if target_sum <= 0:
-                continue
-
-            adjustments: Dict[str, float] = {}
-            for cat in present_cats:
-                target_share = buckets.get(cat, 0.0) / target_sum
-                current_share = current_totals.get(cat, 0.0) / field_total
-                if current_share <= 0:
-                    if config.mode == "strict" and target_share > 0:
-                        raise ValueError(
-                            f"Raking failed: category '{cat}' for field '{field}' has no personas"
-                        )
-                    adjustments[cat] = 1.0
-                else:
-                    adjustments[cat] = target_share / current_share
-
-            for persona in personas_list:
-                category = _category_value(persona, field)
-                if category is None:
+                field_total = current_totals.sum()
+                if field_total <= 0:
                     continue
-                persona.weight *= adjustments.get(category, 1.0)
 
-            total = sum(max(p.weight, 0.0) for p in personas_list) or 1.0
-            for persona in personas_list:
-                persona.weight = max(persona.weight, 0.0) / total
+                present = current_totals > 0
+                missing_required = [
+                    cat for cat, idx in required if idx is None or not present[idx]
+                ]
+                if missing_required and config.mode == "strict":
+                    raise ValueError(
+                        f"Raking failed: field '{field}' missing categories {missing_required}"
+                    )
+
+                target_sum = target[present].sum()
+                if target_sum <= 0:
+                    continue
 
-    total = sum(max(p.weight, 0.0) for p in personas_list) or 1.0
-    for persona in personas_list:
-        persona.weight = max(persona.weight, 0.0) / total
+                adjustments = np.ones(size)
+                adjustments[present] = (target[present] / target_sum) / (
+                    current_totals[present] / field_total
+                )
+                cell_weights[coded] *= adjustments[codes]
+                cell_weights = _normalised(cell_weights)
+
+        cell_factors = np.divide(
+            cell_weights,
+            base_cell_weights,
+            out=np.zeros_like(cell_weights),
+            where=base_cell_weights > 0,
+        )
+        weights = _normalised(weights * cell_factors[cell_index])
+
+    for persona, weight in zip(personas_list, weights):
+        persona.weight = float(weight)
 
     return personas_list
 
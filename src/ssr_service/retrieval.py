@@ -9,6 +9,7 @@ from typing import Optional
 import httpx
 from bs4 import BeautifulSoup
 
+from .http_client import get_http_client
 from .models import ConceptInput
 
 
@@ -39,9 +40,13 @@ def _clean_text(text: str) -> str:
 
 
 async def fetch_url_text(url: str) -> tuple[Optional[str], str]:
-    async with httpx.AsyncClient(follow_redirects=True, timeout=15.0) as client:
-        response = await client.get(url)
-        response.raise_for_status()
+    shared = get_http_client()
+    if shared is not None:
+        response = await shared.get(url, follow_redirects=True, timeout=15.0)
+    else:
+        async with httpx.AsyncClient(follow_redirects=True, timeout=15.0) as client:
+            response = await client.get(url)
+    response.raise_for_status()
 
     soup = BeautifulSoup(response.text, "html.parser")
     title_node = soup.title.string if soup.title else None
@@ -6,7 +6,7 @@ import argparse
 import asyncio
 import json
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable, Iterator
 
 import yaml
 
@@ -28,6 +28,14 @@ from .persona_inputs import (
 )
 from .simple_interface import run_simple_simulation
 
+# Repeatable expression flags and the parser applied to each occurrence.
+_EXPRESSION_PARSERS: tuple[tuple[str, Callable[[str], Any]], ...] = (
+    ("persona_filter", parse_filter_expression),
+    ("persona_generation", parse_generation_expression),
+    ("persona_injection", parse_injection_payload),
+    ("question_spec", parse_question_spec_expression),
+)
+
 
 def _build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(
@@ -125,6 +133,15 @@ def _build_parser() -> argparse.ArgumentParser:
         default=0,
         help="Base seed for panel reuse and deterministic sampling.",
     )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=None,
+        help=(
+            "Max concurrent LLM calls per provider across the simulation "
+            "(default: MAX_CONCURRENCY, capped at 64)."
+        ),
+    )
     parser.add_argument(
         "--panel-context",
         default=None,
@@ -165,25 +182,25 @@ def _build_parser() -> argparse.ArgumentParser:
     return parser
 
 
-def _print_human_summary(response: Any) -> None:
+def _iter_summary_lines(response: Any) -> Iterator[str]:
     aggregate = response["aggregate"]
-    print("=== Aggregate ===")
-    print(f"Mean: {aggregate['mean']:.2f}")
-    print(f"Top-2 box: {aggregate['top2box']:.1%}")
-    print(f"Sample size: {aggregate['sample_n']}")
+    yield "=== Aggregate ==="
+    yield f"Mean: {aggregate['mean']:.2f}"
+    yield f"Top-2 box: {aggregate['top2box']:.1%}"
+    yield f"Sample size: {aggregate['sample_n']}"
     if response.get("questions"):
-        print()
-        print("=== Questions ===")
+        yield ""
+        yield "=== Questions ==="
         for question in response["questions"]:
             dist = question["aggregate"]
-            print(f"- {question['question_id']}: {question['question']}")
-            print(f"  Mean {dist['mean']:.2f} | Top-2 {dist['top2box']:.1%}")
-    print()
-    print("=== Personas ===")
+            yield f"- {question['question_id']}: {question['question']}"
+            yield f"  Mean {dist['mean']:.2f} | Top-2 {dist['top2box']:.1%}"
+    yield ""
+    yield "=== Personas ==="
     for persona_result in response["personas"]:
         persona = persona_result["persona"]
         distribution = persona_result["distribution"]
-        print(f"- {persona['name']} (weight {persona['weight']:.0%})")
+        yield f"- {persona['name']} (weight {persona['weight']:.0%})"
         traits = [
             part
             for part in [
@@ -194,23 +211,26 @@ def _print_human_summary(response: Any) -> None:
             if part
         ]
         if traits:
-            print(f"  Traits: {', '.join(traits)}")
+            yield f"  Traits: {', '.join(traits)}"
         if persona.get("habits"):
-            print(f"  Habits: {', '.join(persona['habits'][:2])}")
-        print(
-            f"  Mean {distribution['mean']:.2f} | Top-2 {distribution['top2box']:.1%}"
-        )
+            yield f"  Habits: {', '.join(persona['habits'][:2])}"
+        yield f"  Mean {distribution['mean']:.2f} | Top-2 {distribution['top2box']:.1%}"
         themes = persona_result.get("themes") or []
         if themes:
-            print(f"  Themes: {', '.join(themes)}")
-        print()
-    print("=== Metadata ===")
+            yield f"  Themes: {', '.join(themes)}"
+        yield ""
+    yield "=== Metadata ==="
     for key, value in response.get("metadata", {}).items():
-        print(f"{key}: {value}")
+        yield f"{key}: {value}"
+
+
+def _print_human_summary(response: Any) -> None:
+    # One write for the whole report instead of a print() per line.
+    print("\n".join(_iter_summary_lines(response)))
 
 
 def _load_questionnaire(path: Path) -> list[QuestionSpec]:
-    data = yaml.safe_load(path.read_text(encoding="utf-8"))
+    data = yaml.safe_load(path.read_bytes())
     if data is None:
         return []
     if isinstance(data, dict):
@@ -241,16 +261,13 @@ def main() -> None:
     args = parser.parse_args()
 
     try:
-        persona_filters = [
-            parse_filter_expression(expr) for expr in (args.persona_filter or [])
-        ]
-        persona_generations = [
-            parse_generation_expression(expr)
-            for expr in (args.persona_generation or [])
-        ]
-        persona_injections = [
-            parse_injection_payload(expr) for expr in (args.persona_injection or [])
-        ]
+        parsed = {
+            dest: [parse(expr) for expr in (getattr(args, dest) or [])]
+            for dest, parse in _EXPRESSION_PARSERS
+        }
+        persona_filters = parsed["persona_filter"]
+        persona_generations = parsed["persona_generation"]
+        persona_injections = parsed["persona_injection"]
         population_spec = (
             parse_population_spec_input(args.population_spec)
             if args.population_spec
@@ -260,11 +277,7 @@ def main() -> None:
         questionnaire: list[QuestionSpec] = []
         if args.questionnaire:
             questionnaire.extend(_load_questionnaire(args.questionnaire))
-        if args.question_spec:
-            questionnaire.extend(
-                parse_question_spec_expression(expr)
-                for expr in (args.question_spec or [])
-            )
+        questionnaire.extend(parsed["question_spec"])
     except ValueError as exc:  # pragma: no cover - exercised via CLI usage
         parser.error(str(exc))
 
@@ -311,6 +324,7 @@ def main() -> None:
                 providers=args.provider or ["openai"],
                 include_respondents=args.include_respondents,
                 seed=args.seed,
+                concurrency=args.concurrency,
             ),
             panel_context=panel_context,
         )
@@ -343,6 +357,7 @@ def main() -> None:
         include_respondents=args.include_respondents,
         seed=args.seed,
         panel_context=panel_context,
+        concurrency=args.concurrency,
     )
 
     response_dict = response.model_dump()
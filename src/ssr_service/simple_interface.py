@@ -6,6 +6,7 @@ import asyncio
 from pathlib import Path
 from typing import List, Optional
 
+from .http_client import get_http_client, scoped_http_client
 from .models import (
     ConceptInput,
     PanelContextSpec,
@@ -45,6 +46,7 @@ def build_simple_request(
     include_respondents: bool = False,
     seed: int = 0,
     panel_context: PanelContextSpec | None = None,
+    concurrency: Optional[int] = None,
 ) -> SimulationRequest:
     """Create a `SimulationRequest` with sensible defaults for quick runs."""
     if not concept_text and not concept_url:
@@ -68,6 +70,7 @@ def build_simple_request(
         providers=providers or ["openai"],
         include_respondents=include_respondents,
         seed=seed,
+        concurrency=concurrency,
     )
 
     return SimulationRequest(
@@ -109,6 +112,7 @@ def run_simple_simulation(
     include_respondents: bool = False,
     seed: int = 0,
     panel_context: PanelContextSpec | None = None,
+    concurrency: Optional[int] = None,
 ) -> SimulationResponse:
     """Run a simulation end-to-end using the simplified configuration."""
     request = build_simple_request(
@@ -133,8 +137,24 @@ def run_simple_simulation(
         include_respondents=include_respondents,
         seed=seed,
         panel_context=panel_context,
+        concurrency=concurrency,
     )
-    return asyncio.run(run_simulation(request))
+    return asyncio.run(run_request_async(request))
 
 
-__all__ = ["build_simple_request", "run_simple_simulation"]
+async def run_request_async(request: SimulationRequest) -> SimulationResponse:
+    """Await a simulation on the caller's event loop.
+
+    Use this instead of :func:`run_simple_simulation` from code that already
+    runs an event loop (notebooks, async apps), so no throwaway loop is created.
+    Outside the API server, the run opens its own pooled HTTP client so every
+    LLM call reuses keep-alive connections; overlapping runs each get their own.
+    """
+    if get_http_client() is not None:
+        return await run_simulation(request)
+
+    async with scoped_http_client():
+        return await run_simulation(request)
+
+
+__all__ = ["build_simple_request", "run_request_async", "run_simple_simulation"]
@@ -13,15 +13,6 @@ from .config import get_settings
 from .embedding import embed_text, embed_texts
 
 
-def _cosine_similarity(vec: np.ndarray, mat: np.ndarray) -> np.ndarray:
-    vec_norm = np.linalg.norm(vec)
-    if vec_norm == 0:
-        return np.zeros(mat.shape[0])
-    mat_norms = np.linalg.norm(mat, axis=1)
-    denom = np.clip(vec_norm * mat_norms, a_min=1e-8, a_max=None)
-    return (mat @ vec) / denom
-
-
 @dataclass(slots=True)
 class AnchorEmbeddings:
     anchor_set: AnchorSet
@@ -35,7 +26,13 @@ class SemanticSimilarityRater:
         self.bank = bank
         self.epsilon = epsilon
         self._embedded_sets: List[AnchorEmbeddings] = self._embed_anchors(bank)
-        self._ratings = list(self.bank.anchor_sets[0].anchors.keys())
+        self._ratings = list(bank.ratings())
+        # All anchor sets share the same ratings, so their embeddings stack into
+        # one (sets, ratings, dim) block scored with a single matrix product.
+        self._anchor_matrix = np.stack(
+            [embed.embeddings for embed in self._embedded_sets]
+        )
+        self._anchor_norms = np.linalg.norm(self._anchor_matrix, axis=2)
 
     @staticmethod
     def _embed_anchors(bank: AnchorBank) -> List[AnchorEmbeddings]:
@@ -51,32 +48,44 @@ class SemanticSimilarityRater:
     def ratings(self) -> List[int]:
         return self._ratings
 
+    def _score_vectors(self, vectors: np.ndarray) -> np.ndarray:
+        """Return Likert pmfs for a (texts, dim) block of embeddings."""
+
+        sets, ratings, dim = self._anchor_matrix.shape
+        dots = (vectors @ self._anchor_matrix.reshape(sets * ratings, dim).T).reshape(
+            len(vectors), sets, ratings
+        )
+        vec_norms = np.linalg.norm(vectors, axis=1)
+        denom = np.clip(
+            vec_norms[:, None, None] * self._anchor_norms[None, :, :],
+            a_min=1e-8,
+            a_max=None,
+        )
+        sims = dots / denom
+        sims[vec_norms == 0] = 0.0
+        sims = np.maximum(sims, 0.0) + self.epsilon
+        per_set_pmf = sims / sims.sum(axis=2, keepdims=True)
+        pmf = per_set_pmf.mean(axis=1)
+        return pmf / pmf.sum(axis=1, keepdims=True)
+
     def score_text(self, text: str) -> np.ndarray:
         """Return Likert pmf for a single text."""
 
-        text_vec = embed_text(text)
-        per_set_pmf: List[np.ndarray] = []
-
-        for embed in self._embedded_sets:
-            sims = _cosine_similarity(text_vec, embed.embeddings)
-            sims = np.maximum(sims, 0.0) + self.epsilon
-            pmf = sims / sims.sum()
-            per_set_pmf.append(pmf)
-
-        stacked = np.vstack(per_set_pmf)
-        pmf = stacked.mean(axis=0)
-        return pmf / pmf.sum()
+        return self._score_vectors(embed_text(text)[None, :])[0]
 
     def score_many(self, texts: Iterable[str]) -> np.ndarray:
-        return np.vstack([self.score_text(text) for text in texts])
+        """Return Likert pmfs for several texts using one embedding request."""
+
+        texts_list = list(texts)
+        if not texts_list:
+            return np.empty((0, self._anchor_matrix.shape[1]))
+        return self._score_vectors(embed_texts(texts_list))
 
 
 def likert_metrics(pmf: np.ndarray, ratings: Iterable[int]) -> Tuple[float, float]:
-    rating_list = list(ratings)
-    mean = float(np.dot(pmf, rating_list))
-    top2 = float(
-        sum(p for p, r in zip(pmf, rating_list) if r >= max(rating_list) - 1)
-    )
+    rating_array = np.fromiter(ratings, dtype=float)
+    mean = float(np.dot(pmf, rating_array))
+    top2 = float(np.asarray(pmf)[rating_array >= rating_array.max() - 1].sum())
     return mean, top2
 
 
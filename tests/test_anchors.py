@@ -0,0 +1,53 @@
+"""Tests for anchor bank loading."""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+import pytest
+
+from ssr_service.anchors import AnchorBank, AnchorSet, load_anchor_bank
+
+ANCHOR_YAML = """\
+version: "1"
+intent: purchase_intent
+anchor_sets:
+  - id: base
+    anchors:
+      1: "Definitely would not buy"
+      2: "Probably would not buy"
+      3: "Definitely would buy"
+"""
+
+
+def test_load_anchor_bank_reuses_parsed_bank_until_file_changes(
+    tmp_path: Path,
+) -> None:
+    path = tmp_path / "anchors.yml"
+    path.write_text(ANCHOR_YAML, encoding="utf-8")
+
+    first = load_anchor_bank(path)
+    assert load_anchor_bank(path) is first
+    assert list(first.ratings()) == [1, 2, 3]
+
+    with pytest.raises(TypeError):
+        first.anchor_sets[0].anchors[4] = "Extra"  # ty: ignore[invalid-assignment]
+
+    path.write_text(ANCHOR_YAML.replace("Definitely would buy", "Will buy"))
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    reloaded = load_anchor_bank(path)
+    assert reloaded is not first
+    assert reloaded.anchor_sets[0].anchors[3] == "Will buy"
+
+
+def test_anchor_bank_ratings_follow_sorted_anchor_order() -> None:
+    anchor_set = AnchorSet(id="base", anchors={3: "high", 1: "low", 2: "mid"})
+    bank = AnchorBank(
+        version="1", intent="purchase_intent", locale="en-US", anchor_sets=[anchor_set]
+    )
+
+    assert anchor_set.sorted_items() == ((1, "low"), (2, "mid"), (3, "high"))
+    assert tuple(bank.ratings()) == (1, 2, 3)
@@ -2,13 +2,21 @@
 
 from __future__ import annotations
 
+import io
 import json
 from types import SimpleNamespace
 
+import httpx
 import pytest
 
-from ssr_service.audience_builder import parse_evidence, synthesize_panel
+from ssr_service import audience_builder
+from ssr_service.audience_builder import (
+    parse_evidence,
+    parse_evidence_async,
+    synthesize_panel,
+)
 from ssr_service.config import AppSettings
+from ssr_service.http_client import set_http_client
 
 
 class TestParseEvidence:
@@ -76,18 +84,102 @@ Carol,45,Low,US"""
 
         assert "text as bytes" in result
 
+    def test_parse_file_objects_matches_bytes(self):
+        """Spooled upload files summarize the same as their full contents."""
+        files = [
+            ("data.csv", b"col1,col2\r\na,b\r\nc,d"),
+            ("notes.txt", ("long notes " * 1000).encode()),
+            ("survey.json", b'{"sample_size": 100}'),
+        ]
+
+        streamed = parse_evidence([(name, io.BytesIO(data)) for name, data in files])
+
+        assert streamed == parse_evidence(files)
+
     def test_empty_csv(self):
         """Test handling of empty CSV."""
         result = parse_evidence([("empty.csv", "")])
 
         assert "Empty CSV" in result or "Failed to parse" in result
 
+    def test_csv_arrow_samples_match_stdlib(self):
+        """The pyarrow CSV path reports the same rows, columns and values."""
+        pytest.importorskip("pyarrow")
+        content = "name,age\nAlice,30\nBob,\nAlice,41\n"
+
+        rows, columns, samples = audience_builder._csv_samples_arrow(content, 50)
+        expected = audience_builder._csv_samples_stdlib(content, 50)
+
+        assert (rows, columns) == expected[:2]
+        assert [set(values) for values in samples] == [set(v) for v in expected[2]]
+
     def test_malformed_json(self):
         """Test handling of malformed JSON."""
         result = parse_evidence([("bad.json", "not valid json {")])
 
         assert "Failed to parse JSON" in result
 
+    def test_oversized_json_array_streams_leading_items(self):
+        """Large JSON arrays only have their first items decoded."""
+        json_content = json.dumps([{"name": f"person-{i}"} for i in range(20_000)])
+
+        result = parse_evidence([("big.json", json_content)])
+
+        assert "[big.json] JSON array (first 10 items shown" in result
+        assert "person-9" in result
+        assert "person-10" not in result
+
+    def test_oversized_json_object_is_summarized_as_text(self):
+        """Large non-array JSON falls back to a text summary."""
+        json_content = json.dumps({f"key-{i}": i for i in range(20_000)})
+
+        result = parse_evidence([("big.json", json_content)])
+
+        assert "[big.json] Text (truncated to 5000 chars)" in result
+
+    def test_parse_pdf_stops_at_char_cap(self, monkeypatch):
+        """PDF pages past the 8000-char budget are never extracted."""
+        extracted: list[int] = []
+
+        class FakePage:
+            def __init__(self, index: int) -> None:
+                self.index = index
+
+            def get_text(self, *args, **kwargs) -> str:
+                extracted.append(self.index)
+                return "x" * 3000
+
+        class FakeDoc:
+            page_count = 10
+            closed = False
+
+            def __getitem__(self, index: int) -> FakePage:
+                return FakePage(index)
+
+            def close(self) -> None:
+                self.closed = True
+
+        doc = FakeDoc()
+        monkeypatch.setattr(audience_builder, "_FITZ_OPEN", lambda **kwargs: doc)
+
+        result = parse_evidence([("deck.pdf", b"%PDF-1.4")])
+
+        assert extracted == [0, 1, 2]
+        assert doc.closed
+        assert "[Page 3]" in result
+        assert result.endswith("...")
+
+
+@pytest.mark.asyncio
+async def test_parse_evidence_async_matches_sequential_order():
+    files = [
+        ("data.csv", "col1,col2\na,b\nc,d"),
+        ("notes.txt", b"Some text notes here."),
+        ("survey.json", '{"sample_size": 100}'),
+    ]
+
+    assert await parse_evidence_async(files) == parse_evidence(files)
+
 
 @pytest.mark.asyncio
 async def test_synthesize_panel_uses_async_openai(monkeypatch):
@@ -116,19 +208,35 @@ async def test_synthesize_panel_uses_async_openai(monkeypatch):
                 ]
             )
 
+    created: list[object] = []
+
     class DummyClient:
         def __init__(self, **kwargs):  # noqa: ANN003
             _ = kwargs
             self.chat = SimpleNamespace(completions=DummyCompletions())
+            created.append(self)
 
     monkeypatch.setattr("openai.AsyncOpenAI", DummyClient)
+    audience_builder._pooled_synthesis_client.cache_clear()
 
     settings = AppSettings(openai_api_key="dummy-key")
     spec, reasoning = await synthesize_panel(
         evidence_summary="Survey transcript",
         settings=settings,
     )
-
+    await synthesize_panel(evidence_summary="More evidence", settings=settings)
+    assert len(created) == 2
+
+    async with httpx.AsyncClient() as pool:
+        set_http_client(pool)
+        try:
+            await synthesize_panel(evidence_summary="Pooled", settings=settings)
+            await synthesize_panel(evidence_summary="Pooled again", settings=settings)
+        finally:
+            set_http_client(None)
+            audience_builder._pooled_synthesis_client.cache_clear()
+
+    assert len(created) == 3
     assert spec.injections
     assert spec.injections[0].persona.region == "TH"
     assert "Thai" in reasoning
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from ssr_service import cache
+from ssr_service.config import AppSettings
 
 
 def test_cache_isolated_by_namespace() -> None:
@@ -20,3 +21,36 @@ def test_cache_isolated_by_namespace() -> None:
         == "anthropic-response"
     )
     assert cache.get_from_cache(prompt, namespace="gemini:1.5") is None
+
+
+def test_cache_evicts_least_recently_used(monkeypatch) -> None:
+    cache._CACHE.clear()
+    monkeypatch.setattr(
+        cache, "get_settings", lambda: AppSettings(llm_cache_max_entries=2)
+    )
+
+    cache.add_to_cache("a", "A")
+    cache.add_to_cache("b", "B")
+    assert cache.get_from_cache("a") == "A"  # "b" is now least recently used
+    cache.add_to_cache("c", "C")
+
+    assert cache.get_from_cache("b") is None
+    assert cache.get_from_cache("a") == "A"
+    assert cache.get_from_cache("c") == "C"
+
+
+def test_cache_entries_expire(monkeypatch) -> None:
+    cache._CACHE.clear()
+    monkeypatch.setattr(
+        cache, "get_settings", lambda: AppSettings(llm_cache_ttl_seconds=60)
+    )
+    now = 1_000.0
+    monkeypatch.setattr(cache.time, "monotonic", lambda: now)
+
+    cache.add_to_cache("prompt", "response")
+    assert cache.get_from_cache("prompt") == "response"
+
+    now += 61
+    assert cache.get_from_cache("prompt") is None
+    assert not cache._CACHE
+
@@ -29,3 +29,9 @@ def test_cors_allow_origins_parses_comma_separated_origins(monkeypatch):
         "https://b.example",
         "https://c.example",
     ]
+
+
+def test_keep_raw_responses_reads_ssr_keep_raw(monkeypatch):
+    monkeypatch.setenv("SSR_KEEP_RAW", "1")
+
+    assert AppSettings().keep_raw_responses is True
@@ -23,10 +23,13 @@ def patch_db_path(monkeypatch):
     db_module._engine = None
     db_module._Session = None
     yield
-    # Cleanup: remove the test database
-    test_db = Path(_temp_dir) / "test_runs.db"
-    if test_db.exists():
-        test_db.unlink()
+    # Cleanup: close pooled connections, then remove the database and WAL files
+    if db_module._engine is not None:
+        db_module._engine.dispose()
+    for suffix in ("", "-wal", "-shm"):
+        test_db = Path(_temp_dir) / f"test_runs.db{suffix}"
+        if test_db.exists():
+            test_db.unlink()
 
 
 def test_save_and_get_run():
@@ -54,6 +57,22 @@ def test_save_and_get_run():
     assert result["response"]["aggregate"]["mean"] == 3.5
 
 
+def test_save_run_accepts_preencoded_json():
+    from ssr_service.db import get_run, init_db, save_run
+
+    init_db()
+
+    run_id = save_run(
+        request_data='{"concept": {"title": "Encoded"}}',
+        response_data='{"aggregate": {"mean": 4.0}}',
+    )
+
+    result = get_run(run_id)
+    assert result is not None
+    assert result["request"]["concept"]["title"] == "Encoded"
+    assert result["response"]["aggregate"]["mean"] == 4.0
+
+
 def test_list_runs():
     from ssr_service.db import init_db, list_runs, save_run
 
@@ -103,3 +122,52 @@ def test_get_run_not_found():
 
     result = get_run("nonexistent-uuid")
     assert result is None
+
+
+def test_save_runs_inserts_batch_in_order():
+    from ssr_service.db import RunData, get_run, init_db, save_runs
+
+    init_db()
+
+    run_ids = save_runs(
+        [
+            RunData(
+                request_data={"index": i},
+                response_data='{"ok": true}',
+                label=f"Batch {i}",
+            )
+            for i in range(3)
+        ]
+    )
+
+    assert len(run_ids) == 3
+    for i, run_id in enumerate(run_ids):
+        result = get_run(run_id)
+        assert result is not None
+        assert result["label"] == f"Batch {i}"
+        assert result["request"] == {"index": i}
+        assert result["status"] == "completed"
+
+
+def test_init_db_enables_wal():
+    from ssr_service import db
+
+    db.init_db()
+    assert db._engine is not None
+    with db._engine.connect() as conn:
+        assert conn.exec_driver_sql("PRAGMA journal_mode").scalar() == "wal"
+
+
+def test_list_runs_uses_created_at_index():
+    from ssr_service import db
+
+    db.init_db()
+    assert db._engine is not None
+    with db._engine.connect() as conn:
+        plan = conn.exec_driver_sql(
+            "EXPLAIN QUERY PLAN SELECT * FROM runs ORDER BY created_at DESC LIMIT 10"
+        ).all()
+
+    details = " ".join(str(row[-1]) for row in plan)
+    assert "ix_runs_created_at_desc" in details
+    assert "TEMP B-TREE" not in details
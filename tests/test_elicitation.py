@@ -0,0 +1,95 @@
+"""Tests for batched rationale elicitation."""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+from typing import cast
+
+import pytest
+from openai import AsyncOpenAI
+
+from ssr_service.elicitation import (
+    ElicitationClient,
+    ElicitationResult,
+    _parse_rationale,
+    generate_batch,
+)
+from ssr_service.models import PersonaSpec
+
+
+@pytest.mark.asyncio
+async def test_generate_batch_requests_samples_with_n() -> None:
+    requested: list[int] = []
+
+    class FakeClient:
+        async def generate_rationales(self, **kwargs) -> list[ElicitationResult]:  # noqa: ANN003
+            requested.append(kwargs["n"])
+            return [
+                ElicitationResult(rationale=f"r{i}", used_model="m")
+                for i in range(kwargs["n"])
+            ]
+
+    results = await generate_batch(
+        cast(ElicitationClient, FakeClient()),
+        persona=PersonaSpec(name="Shopper"),
+        prompt_block="Concept",
+        question="Would you buy it?",
+        n=20,
+    )
+
+    assert sorted(requested) == [4, 16]
+    assert len(results) == 20
+
+
+def _client_returning_one_choice(requested: list[int], fail_on: int = 0) -> ElicitationClient:
+    async def create(**kwargs):  # noqa: ANN003
+        requested.append(kwargs["n"])
+        if len(requested) == fail_on:
+            raise RuntimeError("transient")
+        message = SimpleNamespace(content=f'{{"rationale": "r{len(requested)}"}}')
+        return SimpleNamespace(choices=[SimpleNamespace(message=message)], model="m")
+
+    client = ElicitationClient.__new__(ElicitationClient)
+    chat = SimpleNamespace(completions=SimpleNamespace(create=create))
+    client._client = cast(AsyncOpenAI, SimpleNamespace(chat=chat))
+    client._model = "m"
+    return client
+
+
+@pytest.mark.asyncio
+async def test_generate_batch_requests_shortfall_when_n_is_ignored() -> None:
+    requested: list[int] = []
+
+    results = await generate_batch(
+        _client_returning_one_choice(requested),
+        persona=PersonaSpec(name="Shopper"),
+        prompt_block="Concept",
+        question="Would you buy it?",
+        n=3,
+    )
+
+    assert requested == [3, 2, 1]
+    assert [res.rationale for res in results] == ["r1", "r2", "r3"]
+
+
+@pytest.mark.asyncio
+async def test_generate_batch_keeps_samples_received_before_a_failure() -> None:
+    requested: list[int] = []
+
+    results = await generate_batch(
+        _client_returning_one_choice(requested, fail_on=2),
+        persona=PersonaSpec(name="Shopper"),
+        prompt_block="Concept",
+        question="Would you buy it?",
+        n=3,
+    )
+
+    assert requested == [3, 2, 2, 1]
+    assert [res.rationale for res in results] == ["r1", "r3", "r4"]
+
+
+def test_parse_rationale_falls_back_to_raw_text_for_non_string_values() -> None:
+    assert _parse_rationale('{"rationale": "Too pricey."}') == "Too pricey."
+    assert _parse_rationale('{"rationale": 5}') == '{"rationale": 5}'
+    assert _parse_rationale('{"rationale": {"text": "x"}}') == '{"rationale": {"text": "x"}}'
+    assert _parse_rationale("[1, 2]") == "[1, 2]"
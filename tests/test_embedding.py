@@ -0,0 +1,44 @@
+"""Tests for embedding batching and caching."""
+
+from __future__ import annotations
+
+import base64
+from types import SimpleNamespace
+
+import numpy as np
+
+from ssr_service import embedding
+
+
+def test_embed_texts_only_requests_uncached_distinct_texts(monkeypatch) -> None:
+    requests: list[list[str]] = []
+
+    class FakeEmbeddings:
+        def create(self, *, model: str, input: list[str], encoding_format: str):  # noqa: A002
+            _ = model
+            assert encoding_format == "base64"
+            requests.append(list(input))
+            return SimpleNamespace(
+                data=[
+                    SimpleNamespace(
+                        embedding=base64.b64encode(
+                            np.array([len(text), 1.0], dtype="<f4").tobytes()
+                        ).decode()
+                    )
+                    for text in input
+                ]
+            )
+
+    monkeypatch.setattr(
+        embedding, "_get_client", lambda: SimpleNamespace(embeddings=FakeEmbeddings())
+    )
+    embedding._EMBED_CACHE.clear()
+
+    first = embedding.embed_texts(["a", "bb", "a"])
+    second = embedding.embed_texts(["bb", "ccc"])
+    embedding._EMBED_CACHE.clear()
+
+    assert requests == [["a", "bb"], ["ccc"]]
+    assert first.dtype == np.float32
+    np.testing.assert_array_equal(first, [[1.0, 1.0], [2.0, 1.0], [1.0, 1.0]])
+    np.testing.assert_array_equal(second, [[2.0, 1.0], [3.0, 1.0]])
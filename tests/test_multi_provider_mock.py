@@ -26,9 +26,9 @@ from ssr_service.orchestrator import run_simulation
 @patch("ssr_service.llm.openai_client.get_from_cache", return_value=None)
 @patch("ssr_service.llm.anthropic_client.get_from_cache", return_value=None)
 @patch("ssr_service.llm.gemini_client.get_from_cache", return_value=None)
-@patch("ssr_service.llm.perplexity_client.get_from_cache", return_value=None)
+# Perplexity reuses the OpenAI-compatible flow, so the openai_client patch covers it.
 async def test_multi_provider_simulation(
-    mock_cache_perp, mock_cache_gem, mock_cache_anth, mock_cache_oa,
+    mock_cache_gem, mock_cache_anth, mock_cache_oa,
     mock_embed_single, mock_embed_multi,
     mock_perplexity, mock_gemini, mock_anthropic, mock_openai
 ):
@@ -84,3 +84,69 @@ async def test_multi_provider_simulation(
         
         assert len(response.personas[0].rationales) == 4
         # We expect 4 rationales, one from each mocked provider
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("raw_text", "expected"),
+    [
+        ('Sure! {"rationale": "Fits my routine."} Hope that helps.', "Fits my routine."),
+        ("No JSON here at all.", "No JSON here at all."),
+        ("Broken {rationale: nope}", "Broken {rationale: nope}"),
+    ],
+)
+@patch("ssr_service.llm.anthropic_client.add_to_cache")
+@patch("ssr_service.llm.anthropic_client.get_from_cache", return_value=None)
+@patch("ssr_service.llm.anthropic_client.AsyncAnthropic")
+async def test_anthropic_extracts_json_from_preamble(
+    mock_anthropic, mock_cache_get, mock_cache_add, raw_text, expected
+):
+    from ssr_service.llm.anthropic_client import AnthropicProvider
+
+    mock_anthropic_instance = mock_anthropic.return_value
+    mock_anthropic_instance.messages.create = AsyncMock()
+    mock_anthropic_instance.messages.create.return_value.content[0].text = raw_text
+
+    with patch.dict(os.environ, {"ANTHROPIC_API_KEY": "dummy"}):
+        get_settings.cache_clear()
+        provider = AnthropicProvider()
+    get_settings.cache_clear()
+
+    response = await provider.generate_rationale(
+        PersonaSpec(name="Test Persona"), "A widget.", "Would you buy it?"
+    )
+
+    assert response.rationale == expected
+
+
+def test_build_rationale_prompt_layout():
+    from ssr_service.llm.base import build_rationale_prompt
+
+    persona = PersonaSpec(name="Brace {Fan}", age="25-34")
+
+    prompt = build_rationale_prompt(persona, "Widget {v2}", "Buy?", seed=7)
+
+    assert prompt.endswith(
+        "Persona: Brace {Fan} (age 25-34).\n"
+        "Stimulus:\nWidget {v2}\n\n"
+        "Question: Buy?\n"
+        "Response ID: 7\n"
+        "Return only the JSON object."
+    )
+    assert '{"rationale": "..."}' in prompt
+    assert "Response ID" not in build_rationale_prompt(persona, "Widget", "Buy?")
+
+
+@pytest.mark.parametrize(
+    ("raw_text", "expected"),
+    [
+        ('{"rationale": "Direct."}', "Direct."),
+        ('Per [1]: {"rationale": "Cited {a} b.", "sources": [1]}', "Cited {a} b."),
+        ('"just a string"', '"just a string"'),
+        ('{"other": 1}', '{"other": 1}'),
+    ],
+)
+def test_parse_embedded_rationale(raw_text, expected):
+    from ssr_service.llm.base import parse_embedded_rationale
+
+    assert parse_embedded_rationale(raw_text) == expected
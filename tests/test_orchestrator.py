@@ -2,12 +2,25 @@
 
 from __future__ import annotations
 
+import asyncio
+from typing import cast
+
+import pytest
+
 from ssr_service.config import AppSettings
-from ssr_service.models import ConceptInput, SimulationOptions, SimulationRequest
+from ssr_service.llm.base import LLMProvider, LLMResponse
+from ssr_service.models import (
+    ConceptInput,
+    PersonaSpec,
+    SimulationOptions,
+    SimulationRequest,
+)
 from ssr_service.orchestrator import (
     _build_question_specs,
     _default_question,
     _infer_locale_from_request,
+    _provider_concurrency,
+    generate_batch,
 )
 
 
@@ -59,3 +72,48 @@ def test_build_question_specs_uses_english_anchor_when_locale_is_en():
         settings=settings,
     )
     assert specs[0].anchor_bank == "purchase_intent_en.yml"
+
+
+def test_provider_concurrency_never_exceeds_max_concurrency():
+    settings = AppSettings(max_concurrency=16)
+    assert _provider_concurrency(SimulationOptions(concurrency=8), settings) == 8
+    assert _provider_concurrency(SimulationOptions(concurrency=500), settings) == 16
+    assert _provider_concurrency(SimulationOptions(), settings) == 16
+    assert _provider_concurrency(SimulationOptions(), AppSettings(max_concurrency=200)) == 64
+
+
+@pytest.mark.asyncio
+async def test_generate_batch_shared_semaphore_caps_in_flight_calls():
+    in_flight = 0
+    peak = 0
+
+    class SlowProvider:
+        provider_name = "dummy"
+
+        async def generate_rationale(self, persona, prompt_block, question, seed=None, temperature=None):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return LLMResponse(rationale=f"r{seed}", provider="dummy", model="m")
+
+    gate = asyncio.Semaphore(3)
+    provider = cast(LLMProvider, SlowProvider())
+    batches = await asyncio.gather(
+        *(
+            generate_batch(
+                provider,
+                PersonaSpec(name=f"P{i}"),
+                "Concept",
+                "Buy?",
+                n=5,
+                seed_offset=i * 10,
+                semaphore=gate,
+            )
+            for i in range(4)
+        )
+    )
+
+    assert peak == 3
+    assert [res.rationale for res in batches[1]] == [f"r{10 + i}" for i in range(5)]
@@ -0,0 +1,57 @@
+"""Tests for persona/question expression parsing."""
+
+from __future__ import annotations
+
+import json
+
+from ssr_service.persona_inputs import (
+    parse_filter_expression,
+    parse_injection_payload,
+    parse_injection_payload_dict,
+    parse_population_spec_input,
+    parse_question_spec_expression,
+)
+
+
+def test_filter_expression_tolerates_spacing_and_bare_tokens() -> None:
+    persona_filter = parse_filter_expression(
+        " group = us_toothpaste_buyers ;include.age=25-44, 45-54;; family ;share=0.5"
+    )
+
+    assert persona_filter.group == "us_toothpaste_buyers"
+    assert persona_filter.include == {"age": ["25-44", "45-54"]}
+    assert persona_filter.keywords == []
+    assert persona_filter.weight_share == 0.5
+
+
+def test_question_spec_value_may_contain_equals() -> None:
+    spec = parse_question_spec_expression("text=Is 2+2=4 obvious?;intent=trust")
+
+    assert spec.text == "Is 2+2=4 obvious?"
+    assert spec.intent == "trust"
+
+
+def test_injection_dict_matches_json_payload() -> None:
+    entry = {"persona": {"name": "Custom", "descriptors": ["loyal"]}, "weight_share": 0.2}
+
+    assert parse_injection_payload_dict(entry) == parse_injection_payload(
+        json.dumps(entry)
+    )
+    assert parse_injection_payload_dict(entry["persona"]).weight_share is None
+
+
+def test_file_payloads_are_read_as_bytes(tmp_path) -> None:
+    injection_path = tmp_path / "injection.json"
+    injection_path.write_text(
+        json.dumps({"persona": {"name": "Café Regular"}, "weight_share": 0.1}),
+        encoding="utf-8",
+    )
+    spec_path = tmp_path / "population.yml"
+    spec_path.write_text("base_group: us_toothpaste_buyers\n", encoding="utf-8")
+
+    injection = parse_injection_payload(str(injection_path))
+    spec = parse_population_spec_input(str(spec_path))
+
+    assert injection.persona.name == "Café Regular"
+    assert injection.weight_share == 0.1
+    assert spec.base_group == "us_toothpaste_buyers"
@@ -2,9 +2,21 @@
 
 from __future__ import annotations
 
-from ssr_service.models import LikertDistribution, PersonaResult, PersonaSpec
+import os
+
+from ssr_service.documents import write_sidecar
+from ssr_service.models import (
+    LikertDistribution,
+    PersonaResult,
+    PersonaSpec,
+    PersonaTemplate,
+)
 from ssr_service.orchestrator import _summarize_personas
-from ssr_service.personas import personas_from_csv
+from ssr_service.personas import (
+    get_persona_library,
+    load_library,
+    personas_from_csv,
+)
 
 
 def test_persona_spec_describe_includes_enriched_fields():
@@ -24,6 +36,21 @@ def test_persona_spec_describe_includes_enriched_fields():
     assert "motivations" in description
 
 
+def test_persona_template_conversion_keeps_aliased_fields():
+    template = PersonaTemplate(
+        purchase_freq="weekly", usage="morning routine", habits=["runs"]
+    )
+
+    persona = template.to_persona_spec(fallback_name="Generated 1")
+
+    assert persona.name == "Generated 1"
+    assert persona.purchase_frequency == "weekly"
+    assert persona.usage_context == "morning routine"
+    assert persona.weight == 1.0
+    assert persona.context == []
+    assert persona.habits == ["runs"] and persona.habits is not template.habits
+
+
 def test_personas_from_csv_parses_enriched_columns(tmp_path):
     csv_path = tmp_path / "panel.csv"
     csv_path.write_text(
@@ -71,3 +98,51 @@ def test_persona_summary_highlights_key_traits():
     assert "Urban Creator" in summary
     assert "Content creator" in summary
     assert "habits" in summary
+
+
+def test_get_persona_library_reloads_when_yaml_changes(tmp_path):
+    group_path = tmp_path / "group.yml"
+    group_path.write_text(
+        "group: demo\npersonas:\n  - name: First\n    weight: 1.0\n",
+        encoding="utf-8",
+    )
+
+    library = get_persona_library(str(tmp_path))
+    assert get_persona_library(str(tmp_path)) is library
+
+    group_path.write_text(
+        "group: demo\npersonas:\n  - name: Second\n    weight: 1.0\n",
+        encoding="utf-8",
+    )
+    stat = group_path.stat()
+    os.utime(group_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    reloaded = get_persona_library(str(tmp_path))
+    assert reloaded is not library
+    assert reloaded.get_group("demo").personas[0].name == "Second"
+
+
+def test_load_library_prefers_fresh_json_sidecar(tmp_path, monkeypatch):
+    library_dir = tmp_path / "personas"
+    library_dir.mkdir()
+    group_path = library_dir / "group.yml"
+    group_path.write_text(
+        "group: demo\npersonas:\n  - name: From YAML\n    weight: 1.0\n",
+        encoding="utf-8",
+    )
+    write_sidecar(group_path)
+
+    def fail_parse(source):
+        raise AssertionError("unexpected YAML parse")
+
+    with monkeypatch.context() as patch:
+        patch.setattr("ssr_service.documents.load_yaml", fail_parse)
+        assert load_library(library_dir)["demo"].personas[0].name == "From YAML"
+
+    group_path.write_text(
+        "group: demo\npersonas:\n  - name: Edited\n    weight: 1.0\n",
+        encoding="utf-8",
+    )
+    stat = group_path.stat()
+    os.utime(group_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    assert load_library(library_dir)["demo"].personas[0].name == "Edited"
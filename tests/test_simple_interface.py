@@ -2,11 +2,13 @@
 
 from __future__ import annotations
 
+import asyncio
 from typing import Any
 
 import pytest
 
 from ssr_service import simple_interface
+from ssr_service.http_client import get_http_client
 from ssr_service.models import (
     LikertDistribution,
     PersonaFilter,
@@ -134,3 +136,61 @@ def test_build_simple_request_dynamic_personas():
     assert request.persona_injections[0].persona.name == "VIP"
     assert request.population_spec == population_spec
     assert request.questions == ["How relevant is this product?"]
+
+
+def test_build_simple_request_sets_concurrency():
+    request = simple_interface.build_simple_request(
+        concept_text="Concept", concurrency=8
+    )
+
+    assert request.options.concurrency == 8
+    assert simple_interface.build_simple_request(
+        concept_text="Concept"
+    ).options.concurrency is None
+
+
+@pytest.mark.asyncio
+async def test_run_request_async_shares_http_pool_for_the_run(monkeypatch):
+    seen: list[object] = []
+
+    async def fake_run_simulation(request: SimulationRequest) -> SimulationResponse:
+        seen.append(get_http_client())
+        raise RuntimeError("stop")
+
+    monkeypatch.setattr(simple_interface, "run_simulation", fake_run_simulation)
+    request = simple_interface.build_simple_request(concept_text="Concept")
+
+    with pytest.raises(RuntimeError):
+        await simple_interface.run_request_async(request)
+
+    assert seen and seen[0] is not None
+    assert get_http_client() is None
+
+
+@pytest.mark.asyncio
+async def test_overlapping_run_request_async_calls_keep_their_own_pool(monkeypatch):
+    closed_mid_run: list[bool] = []
+
+    async def fake_run_simulation(request: SimulationRequest) -> SimulationResponse:
+        client = get_http_client()
+        assert client is not None
+        await asyncio.sleep(0.03)
+        closed_mid_run.append(client.is_closed)
+        raise RuntimeError("stop")
+
+    monkeypatch.setattr(simple_interface, "run_simulation", fake_run_simulation)
+    request = simple_interface.build_simple_request(concept_text="Concept")
+
+    async def delayed_run() -> SimulationResponse:
+        await asyncio.sleep(0.01)
+        return await simple_interface.run_request_async(request)
+
+    results = await asyncio.gather(
+        simple_interface.run_request_async(request),
+        delayed_run(),
+        return_exceptions=True,
+    )
+
+    assert all(isinstance(result, RuntimeError) for result in results)
+    assert closed_mid_run == [False, False]
+    assert get_http_client() is None
@@ -14,3 +14,41 @@ def test_likert_metrics():
     mean, top2 = likert_metrics(pmf, ratings)
     assert mean == 3.0
     assert top2 == 0.7
+
+
+def test_score_many_matches_score_text(monkeypatch):
+    """Batch scoring should agree with scoring texts one at a time."""
+    from ssr_service import ssr
+    from ssr_service.anchors import AnchorBank, AnchorSet
+
+    rng = np.random.default_rng(7)
+    vectors: dict[str, np.ndarray] = {}
+
+    def fake_embed_texts(texts):
+        return np.vstack(
+            [
+                vectors.setdefault(text, rng.normal(size=8).astype(np.float32))
+                for text in texts
+            ]
+        )
+
+    monkeypatch.setattr(ssr, "embed_texts", fake_embed_texts)
+    monkeypatch.setattr(ssr, "embed_text", lambda text: fake_embed_texts([text])[0])
+
+    bank = AnchorBank(
+        version="1",
+        intent="purchase_intent",
+        locale="en-US",
+        anchor_sets=[
+            AnchorSet(id=f"set{idx}", anchors={r: f"anchor {idx}-{r}" for r in range(1, 6)})
+            for idx in range(2)
+        ],
+    )
+    rater = ssr.SemanticSimilarityRater(bank)
+    texts = ["loves it", "not for me", "maybe later"]
+
+    batch = rater.score_many(texts)
+    assert batch.shape == (3, 5)
+    for row, text in zip(batch, texts):
+        assert np.allclose(row, rater.score_text(text))
+        assert np.isclose(row.sum(), 1.0)